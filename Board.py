@@ -1,7 +1,9 @@
 from collections import deque
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
-from constants import NEIGHBOURS, ZOBRIST_KEYS, God, zobrist_blocks, zobrist_workers, zobrist_turn, athena
+from constants import NEIGHBOURS, NEIGHBOURS_T, NEIGHBOUR_BB, God, zobrist_blocks, zobrist_workers, zobrist_turn, athena, APOLLO, ATHENA, \
+    HERMES, MINOTAUR, PAN
 from Move import Move, ApolloMove, ArtemisMove, AthenaMove, AtlasMove, DemeterMove, HephaestusMove, HermesMove, MinotaurMove, PanMove, \
     PrometheusMove
 
@@ -32,10 +34,71 @@ def _calculate_push_square(from_sq: int, to_sq: int) -> Optional[int]:
     push_sq = push_row * 5 + push_col
     return push_sq
 
+# PUSH_SQ[from_sq][to_sq] == _calculate_push_square(from_sq, to_sq), precomputed for every pair
+PUSH_SQ = tuple(tuple(_calculate_push_square(f, t) for t in range(25)) for f in range(25))
+
+# One-square Hermes paths, shared by every move that steps to that square
+_PATH_STEP = tuple(bytes((sq,)) for sq in range(25))
+
+# bytes.translate table: '0'..'4' -> 0..4, anything else -> 255
+_HEIGHT_BYTE = bytes(c - 48 if 48 <= c <= 52 else 255 for c in range(256))
+_DROP_WORKER_CODES = str.maketrans('', '', 'GBN')
+# Position-string digit -> God member, skipping int() and the Enum value lookup
+_GOD_BY_CHAR = {str(god.value): god for god in God}
+
+# Parsed positions by string. Tuning and test runs rebuild boards from the same strings
+# over and over; the result is immutable and copied into each Board's lists.
+@lru_cache(maxsize=4096)
+def _parse_position(position: str):
+    if len(position) != 54:
+        raise ValueError(f"Invalid position: Expected length 54, got {len(position)}")
+
+    # Heights sit at even offsets and worker codes at odd ones; check each run in C
+    # (str.translate/count/find) and only walk it in Python to name a bad character.
+    heights = position[0:50:2]
+    blocks = heights.encode('ascii', 'replace').translate(_HEIGHT_BYTE)
+    if 255 in blocks:
+        i = blocks.index(255)
+        raise ValueError(f"Invalid block height at index {i}: {heights[i]}")
+    codes = position[1:50:2]
+    if codes.translate(_DROP_WORKER_CODES):
+        i = next(i for i, c in enumerate(codes) if c not in 'GBN')
+        raise ValueError(f"Invalid worker code '{codes[i]}' at index {2 * i + 1}")
+
+    num_gray_workers = codes.count('G')
+    num_blue_workers = codes.count('B')
+    if num_gray_workers != 2 or num_blue_workers != 2:
+        raise ValueError(
+            f"Invalid worker count: Found {num_gray_workers} gray workers and {num_blue_workers} blue workers")
+    gray = codes.find('G')
+    blue = codes.find('B')
+    workers = (gray, codes.find('G', gray + 1), blue, codes.find('B', blue + 1))
+
+    if position[50] == '0':
+        turn = 1
+    elif position[50] == '1':
+        turn = -1
+    else:
+        raise ValueError(f"Invalid turn: Expected '0' or '1', got '{position[50]}'")
+
+    try:
+        gods = (_GOD_BY_CHAR[position[51]], _GOD_BY_CHAR[position[52]])
+    except KeyError:
+        raise ValueError(f"Invalid god indices at positions 51–52: {position[51:53]}") from None
+
+    return tuple(blocks), workers, turn, gods, position[53] == '1'
+
 def _adj_ok(from_sq: int, to_sq: int) -> bool:
     return to_sq in NEIGHBOURS[from_sq]
 
 class Board:
+    # Fixed field set: clone() builds boards field by field, and slots keep those
+    # writes and the hot-path reads off a per-board __dict__.
+    __slots__ = (
+        'blocks', 'workers', 'turn', 'side', 'gods', 'prevent_up_next_turn', 'last_move_height_diff',
+        'won', '_athena_in_game', '_hash', '_generators', '_makers', '_undoers', '_validators',
+    )
+
     def __init__(self, position: str):
         """
         position: 53-char string from the original code snippet, e.g.:
@@ -44,12 +107,14 @@ class Board:
         self.blocks = [0] * 25
         self.workers = [0] * 4
         self.turn = 1
+        self.side = 0                            # 0 => gray to move, 1 => blue (mirrors turn)
         self.gods: List[Optional[God]] = [None, None]
 
         # Additional fields for god effects:
         self.prevent_up_next_turn = False        # Athena's effect
         self.last_move_height_diff = 0           # For Pan's special drop-win
         self.won = False
+        self._athena_in_game = False
         self.parse_position(position)
         self._hash = None
 
@@ -76,52 +141,47 @@ class Board:
         return h
 
     def parse_position(self, position: str):
-        if len(position) != 54:
-            raise ValueError(f"Invalid position: Expected length 54, got {len(position)}")
-
-        num_gray_workers = 0
-        num_blue_workers = 0
-
-        for i in range(25):
-            height = int(position[2 * i])
-            if height < 0 or height > 4:
-                raise ValueError(f"Invalid block height at index {i}: {height}")
-            self.blocks[i] = height
-
-            worker_code = position[2 * i + 1]
-            if worker_code == 'G':
-                if num_gray_workers >= 2:
-                    raise ValueError("Invalid position: More than 2 gray workers found")
-                self.workers[num_gray_workers] = i
-                num_gray_workers += 1
-            elif worker_code == 'B':
-                if num_blue_workers >= 2:
-                    raise ValueError("Invalid position: More than 2 blue workers found")
-                self.workers[2 + num_blue_workers] = i
-                num_blue_workers += 1
-            elif worker_code != 'N':
-                raise ValueError(f"Invalid worker code '{worker_code}' at index {2 * i + 1}")
-
-        if num_gray_workers != 2 or num_blue_workers != 2:
-            raise ValueError(
-                f"Invalid worker count: Found {num_gray_workers} gray workers and {num_blue_workers} blue workers")
-
-        if position[50] == '0':
-            self.turn = 1
-        elif position[50] == '1':
-            self.turn = -1
-        else:
-            raise ValueError(f"Invalid turn: Expected '0' or '1', got '{position[50]}'")
-
-        try:
-            self.gods[0] = God(int(position[51]))
-            self.gods[1] = God(int(position[52]))
-        except ValueError as e:
-            raise ValueError(f"Invalid god indices at positions 51–52: {position[51:53]}") from e
-
-        if position[53] == '1':
+        blocks, workers, self.turn, gods, athena_up = _parse_position(position)
+        self.blocks = list(blocks)
+        self.workers = list(workers)
+        self.side = 0 if self.turn == 1 else 1
+        self.gods = list(gods)
+        if athena_up:
             self.prevent_up_next_turn = True
 
+        # Bind each side's god handlers once instead of building a dispatch dict per call
+        self._bind_god_handlers()
+
+        # Only Athena can raise the flag; one that is already up is cleared in make_move
+        self._athena_in_game = ATHENA in self.gods
+
+    def _bind_god_handlers(self) -> None:
+        """Per-side tuples of the plain functions implementing each god, indexed by self.side."""
+        gray, blue = self.gods
+        self._generators = (_GENERATORS[gray], _GENERATORS[blue])
+        self._makers = (_MAKERS[gray], _MAKERS[blue])
+        self._undoers = (_UNDOERS[gray], _UNDOERS[blue])
+        self._validators = (_VALIDATORS[gray], _VALIDATORS[blue])
+
+    def clone(self) -> 'Board':
+        """Copy the raw state fields directly, skipping the position string round-trip."""
+        new = Board.__new__(Board)
+        new.blocks = self.blocks[:]
+        new.workers = self.workers[:]
+        new.turn = self.turn
+        new.side = self.side
+        new.gods = self.gods[:]
+        new.prevent_up_next_turn = self.prevent_up_next_turn
+        new.last_move_height_diff = self.last_move_height_diff
+        new.won = self.won
+        new._athena_in_game = self._athena_in_game
+        new._hash = self._hash
+        new._generators = self._generators
+        new._makers = self._makers
+        new._undoers = self._undoers
+        new._validators = self._validators
+        return new
+
     def position_to_text(self) -> str:
         position = []
         for i in range(25):
@@ -160,8 +220,7 @@ class Board:
         #    the player who moved is the *opposite* of self.turn. So let's see who actually did it:
         if self.last_move_height_diff <= -2:
             # check if last_player is Pan
-            idx = 0 if last_player == 1 else 1
-            if self.gods[idx] == God.PAN:
+            if self.gods[self.side ^ 1] is PAN:
                 # Pan triggered a special drop-win
                 return 1 if last_player == 1 else -1
 
@@ -175,10 +234,9 @@ class Board:
 
     def move_is_valid(self, move: Move) -> bool:
         """Dispatch validation to the correct god logic (and do basic checks)."""
-        current_player = 0 if self.turn == 1 else 1
-        current_god = self.gods[current_player]
+        current_god = self.gods[self.side]
 
-        if move.god != current_god:
+        if move.god is not current_god:
             return False
 
         if not self._worker_belongs_to_current_player(move.from_sq):
@@ -192,47 +250,12 @@ class Board:
             if self._attempts_to_move_up(move):
                 return False
 
-        god_validators = {
-            God.APOLLO: self._apollo_move_is_valid,
-            God.ARTEMIS: self._artemis_move_is_valid,
-            God.ATHENA: self._athena_move_is_valid,
-            God.ATLAS: self._atlas_move_is_valid,
-            God.DEMETER: self._demeter_move_is_valid,
-            God.HEPHAESTUS: self._hephaestus_move_is_valid,
-            God.HERMES: self._hermes_move_is_valid,
-            God.MINOTAUR: self._minotaur_move_is_valid,
-            God.PAN: self._pan_move_is_valid,
-            God.PROMETHEUS: self._prometheus_move_is_valid,
-        }
-
-        validator = god_validators.get(current_god)
-        if validator is None:
-            return False
-        return validator(move)
-
-    def _make_move_for_god(self, current_god: God, move: Move):
-        god_move_handlers = {
-            God.APOLLO: self._apollo_make_move,
-            God.ARTEMIS: self._artemis_make_move,
-            God.ATHENA: self._athena_make_move,
-            God.ATLAS: self._atlas_make_move,
-            God.DEMETER: self._demeter_make_move,
-            God.HEPHAESTUS: self._hephaestus_make_move,
-            God.HERMES: self._hermes_make_move,
-            God.MINOTAUR: self._minotaur_make_move,
-            God.PAN: self._pan_make_move,
-            God.PROMETHEUS: self._prometheus_make_move,
-        }
-        handler = god_move_handlers.get(current_god)
-        if handler is None:
-            raise Exception(f"No move handler for god {current_god}")
-        handler(move)
+        return self._validators[self.side](self, move)
 
     def make_move(self, move: Move) -> None:
         hash(self)
 
-        current_player = 0 if self.turn == 1 else 1
-        current_god = self.gods[current_player]
+        current_god = self.gods[self.side]
 
         # We'll reset last_move_height_diff each time we do a move.
         self.last_move_height_diff = 0
@@ -242,20 +265,23 @@ class Board:
         else:
             self.won = False
 
-        self._make_move_for_god(current_god, move)
+        self._makers[self.side](self, move)
 
         # After the move is applied, check if the current god is Athena and if they moved up.
         # If so, set the flag to prevent the next player from moving up:
-        if current_god == God.ATHENA and self.last_move_height_diff > 0:
-            if not self.prevent_up_next_turn: self._xor_hash(ZOBRIST_KEYS["athena"])
-            self.prevent_up_next_turn = True
-        else:
-            if self.prevent_up_next_turn: self._xor_hash(ZOBRIST_KEYS["athena"])
-            self.prevent_up_next_turn = False
+        # A flag set from outside (a loaded position, a test) must still be cleared and hashed
+        if self._athena_in_game or self.prevent_up_next_turn:
+            if current_god is ATHENA and self.last_move_height_diff > 0:
+                if not self.prevent_up_next_turn: self._hash ^= athena
+                self.prevent_up_next_turn = True
+            else:
+                if self.prevent_up_next_turn: self._hash ^= athena
+                self.prevent_up_next_turn = False
 
         # Switch turn to the other side
         self.turn *= -1
-        self._xor_hash(ZOBRIST_KEYS['turn'])
+        self.side ^= 1
+        self._hash ^= zobrist_turn
 
 
     ############################################################################
@@ -265,13 +291,11 @@ class Board:
     def _worker_belongs_to_current_player(self, sq: int) -> bool:
         """
         Check if move.from_sq is indeed owned by the current player.
-         - If self.turn == 1 => workers[0..1]
-         - If self.turn == -1 => workers[2..3]
+         - If self.side == 0 => workers[0..1]
+         - If self.side == 1 => workers[2..3]
         """
-        if self.turn == 1:
-            return sq in (self.workers[0], self.workers[1])
-        else:
-            return sq in (self.workers[2], self.workers[3])
+        first = self.side << 1
+        return sq == self.workers[first] or sq == self.workers[first + 1]
 
     def _attempts_to_move_up(self, move: Move) -> bool:
         """Check if from->to is an upward movement of at least +1 block."""
@@ -282,42 +306,40 @@ class Board:
     def _player_has_any_valid_move(self, side: int) -> bool:
         current_player = 0 if side == 1 else 1
         god = self.gods[current_player]
-        worker_indices = [0, 1] if side == 1 else [2, 3]
-
-        for wi in worker_indices:
-            wpos = self.workers[wi]
-            for to_sq in NEIGHBOURS[wpos]:
-                if self.blocks[to_sq] == 4:
+        first = current_player << 1
+        blocks = self.blocks
+        w = self.workers
+        occupied = (1 << w[0]) | (1 << w[1]) | (1 << w[2]) | (1 << w[3])
+        opponents = (1 << w[2 - first]) | (1 << w[3 - first])
+        climb = 0 if self.prevent_up_next_turn else 1
+
+        for wpos in (w[first], w[first + 1]):
+            limit = blocks[wpos] + climb
+            for to_sq in NEIGHBOURS_T[wpos]:
+                to_h = blocks[to_sq]
+                if to_h == 4:
                     continue  # cannot move to dome
 
-                from_h = self.blocks[wpos]
-                to_h = self.blocks[to_sq]
-
-                if god == God.HERMES:
-                    if self.is_free(to_sq):
-                        return True
-
-                if to_h - from_h > 1:
-                    continue  # too high to climb
+                bit = 1 << to_sq
+                if god is HERMES and not occupied & bit:
+                    return True
 
-                if to_h - from_h == 1 and self.prevent_up_next_turn:
-                    continue
+                if to_h > limit:
+                    continue  # too high to climb, or a climb while Athena's restriction is up
 
-                occupant = self._which_worker_is_here(to_sq)
-                if occupant is None:
+                if not occupied & bit:
                     return True
 
                 # Special movement cases:
-                if god == God.APOLLO:
-                    if self._is_opponent_worker(occupant):
-                        for nei in NEIGHBOURS[to_sq]:
+                if opponents & bit:
+                    if god is APOLLO:
+                        for nei in NEIGHBOURS_T[to_sq]:
                             if nei == wpos: continue
                             if self.is_free(nei):
                                 return True
 
-                elif god == God.MINOTAUR:
-                    if self._is_opponent_worker(occupant):
-                        push_sq = _calculate_push_square(wpos, to_sq)
+                    elif god is MINOTAUR:
+                        push_sq = PUSH_SQ[wpos][to_sq]
                         if push_sq is not None and self.is_free(push_sq):
                             return True
 
@@ -333,28 +355,24 @@ class Board:
 
     def _is_opponent_worker(self, worker_index: int) -> bool:
         """True if worker_index belongs to the opposite color from self.turn."""
-        if self.turn == 1:
-            # We are gray => opponent is indexes [2,3]
-            return worker_index in (2, 3)
-        else:
-            # We are blue => opponent is indexes [0,1]
-            return worker_index in (0, 1)
+        # workers 0,1 are gray and 2,3 are blue, so the colour is the index's high bit
+        return (worker_index >> 1) != self.side
 
     def _move_worker(self, move: Move) -> None:
         for wi, wpos in enumerate(self.workers):
             if wpos == move.from_sq:
                 player = _player_of_worker(wi)
-                self._xor_hash(ZOBRIST_KEYS["workers"][move.from_sq][player])
-                self._xor_hash(ZOBRIST_KEYS["workers"][move.final_sq][player])
+                self._hash ^= zobrist_workers[move.from_sq][player]
+                self._hash ^= zobrist_workers[move.final_sq][player]
                 self.workers[wi] = move.final_sq
                 break
 
     def _inc_block(self, sq: int) -> None:
         h = self.blocks[sq]
         if h > 0:
-            self._xor_hash(ZOBRIST_KEYS["blocks"][sq][h - 1])
+            self._hash ^= zobrist_blocks[sq][h - 1]
         self.blocks[sq] += 1
-        self._xor_hash(ZOBRIST_KEYS["blocks"][sq][h])
+        self._hash ^= zobrist_blocks[sq][h]
 
     def _height_ok(self, from_sq: int, to_sq: int) -> bool:
         from_h = self.blocks[from_sq]
@@ -400,13 +418,10 @@ class Board:
 
         if not self._build_ok_sq(move.from_sq, move.to_sq, move.build_sq):
             return False
-        elif self._is_opponent_worker(occupant) and move.from_sq == move.build_sq:
+        elif occupant is not None and move.from_sq == move.build_sq:
             return False
         return True
 
-    def _xor_hash(self, value: int):
-        self._hash ^= value
-
     def _apollo_make_move(self, move: ApolloMove):
         occupant_index = self._which_worker_is_here(move.to_sq)
         orig_index = self.workers.index(move.from_sq)
@@ -415,14 +430,14 @@ class Board:
 
         if occupant_index is not None:
             opp_player = _player_of_worker(occupant_index)
-            self._xor_hash(ZOBRIST_KEYS["workers"][to_sq][opp_player])
-            self._xor_hash(ZOBRIST_KEYS["workers"][from_sq][opp_player])
+            self._hash ^= zobrist_workers[to_sq][opp_player]
+            self._hash ^= zobrist_workers[from_sq][opp_player]
             self.workers[occupant_index] = from_sq
 
         orig_player = _player_of_worker(orig_index)
         self.workers[orig_index] = to_sq
-        self._xor_hash(ZOBRIST_KEYS["workers"][from_sq][orig_player])
-        self._xor_hash(ZOBRIST_KEYS["workers"][to_sq][orig_player])
+        self._hash ^= zobrist_workers[from_sq][orig_player]
+        self._hash ^= zobrist_workers[to_sq][orig_player]
 
         self._inc_block(move.build_sq)
 
@@ -450,13 +465,13 @@ class Board:
         self._move_worker(move)
         h = self.blocks[move.build_sq]
         if h > 0:
-            self._xor_hash(ZOBRIST_KEYS["blocks"][move.build_sq][h - 1])
+            self._hash ^= zobrist_blocks[move.build_sq][h - 1]
         if move.dome:
             self.blocks[move.build_sq] = 4
-            self._xor_hash(ZOBRIST_KEYS["blocks"][move.build_sq][3])
+            self._hash ^= zobrist_blocks[move.build_sq][3]
         else:
             self.blocks[move.build_sq] = h + 1
-            self._xor_hash(ZOBRIST_KEYS["blocks"][move.build_sq][self.blocks[move.build_sq] - 1])
+            self._hash ^= zobrist_blocks[move.build_sq][self.blocks[move.build_sq] - 1]
 
     # ─────────────────────────────────────────────────────────
     # DEMETER
@@ -490,9 +505,9 @@ class Board:
         occupant_index = self._which_worker_is_here(move.to_sq)
         if occupant_index is not None:
             opp_player = _player_of_worker(occupant_index)
-            push_sq = _calculate_push_square(move.from_sq, move.to_sq)
-            self._xor_hash(ZOBRIST_KEYS["workers"][move.to_sq][opp_player])
-            self._xor_hash(ZOBRIST_KEYS["workers"][push_sq][opp_player])
+            push_sq = PUSH_SQ[move.from_sq][move.to_sq]
+            self._hash ^= zobrist_workers[move.to_sq][opp_player]
+            self._hash ^= zobrist_workers[push_sq][opp_player]
             self.workers[occupant_index] = push_sq
         self._move_worker(move)
         self._inc_block(move.build_sq)
@@ -579,12 +594,15 @@ class Board:
     def _hermes_move_is_valid(self, move: HermesMove) -> bool:
         if len(move.squares) == 1:
             return self._complete_checks_sq(move.from_sq, move.final_sq, move.build_sq)
+        blocks = self.blocks
+        starting_height = blocks[move.from_sq]
+        blocked = self._blocked_mask()
         current_pos = move.from_sq
-        staring_height = self.blocks[move.from_sq]
-        for idx, nxt in enumerate(move.squares):
-            if self.blocks[nxt] != staring_height:
-                return False
-            if not self._move_checks_sq(current_pos, nxt):
+        for nxt in move.squares:
+            # every step stays on the starting level, to a free square adjacent to the last one
+            if (blocks[nxt] != starting_height or
+                    not (NEIGHBOUR_BB[current_pos] >> nxt) & 1 or
+                    (blocked >> nxt) & 1):
                 return False
             current_pos = nxt
         if not self._build_ok_sq(move.from_sq, move.final_sq, move.build_sq):
@@ -602,7 +620,7 @@ class Board:
         if occupant is not None:
             if not self._is_opponent_worker(occupant):
                 return False
-            push_sq = _calculate_push_square(move.from_sq, move.to_sq)
+            push_sq = PUSH_SQ[move.from_sq][move.to_sq]
             if push_sq is None or not self.is_free(push_sq):
                 return False
         else:
@@ -634,245 +652,378 @@ class Board:
         return True
 
     def _get_worker_index(self):
-        if self.turn == 1:
-            return self.workers[:2]
-        else:
-            return self.workers[2:]
-
-    def _get_build_sq(self, from_sq: int, to_sq: int) -> List[int]:
-        sq = []
-        for build_sq in NEIGHBOURS[to_sq]:
-            if not self.is_free(build_sq) and (build_sq != from_sq or from_sq == to_sq):
-                continue
-            if build_sq == to_sq:
-                continue
-            sq.append(build_sq)
-        return sq
-
-    def _generate_moves_athena(self):
-        worker_index = self._get_worker_index()
+        first = self.side << 1
+        return self.workers[first:first + 2]
 
+    def _blocked_mask(self) -> int:
+        """
+        Bitmask of the squares nobody can move to or build on: workers and domes.
+        A worker that moved from_sq -> to_sq can build on
+            NEIGHBOUR_BB[to_sq] & (~blocked | (1 << from_sq))
+        i.e. free neighbours plus the square it vacated; when from_sq == to_sq that
+        square is not a neighbour of to_sq, so the extra bit falls away on its own.
+        """
+        w = self.workers
+        mask = (1 << w[0]) | (1 << w[1]) | (1 << w[2]) | (1 << w[3])
+        blocks = self.blocks
+        if 4 in blocks:
+            for sq, h in enumerate(blocks):
+                if h == 4:
+                    mask |= 1 << sq
+        return mask
+
+    def _height_masks(self) -> Tuple[int, Tuple[int, ...]]:
+        """
+        One pass over the blocks. Returns (blocked, at_most): blocked marks workers
+        and domes, at_most[h] marks the squares of height <= h. at_most has an
+        extra top entry so at_most[from_h + 1] needs no clamping for from_h == 3.
+        A worker on from_h may step to
+            NEIGHBOUR_BB[from_sq] & ~blocked & at_most[from_h + 1]
+        (at_most[from_h] while Athena's restriction is up).
+        """
+        levels = [0, 0, 0, 0, 0]
+        for sq, h in enumerate(self.blocks):
+            levels[h] |= 1 << sq
+        w = self.workers
+        blocked = levels[4] | (1 << w[0]) | (1 << w[1]) | (1 << w[2]) | (1 << w[3])
+        le1 = levels[0] | levels[1]
+        le2 = le1 | levels[2]
+        le3 = le2 | levels[3]
+        return blocked, (levels[0], le1, le2, le3, le3)
+
+    def _generate_moves_athena(self, tactical_only: bool = False):
+        blocked, at_most = self._height_masks()
+        up = 0 if self.prevent_up_next_turn else 1
         moves = []
-
-        for wi in worker_index:
-            from_sq = wi
-            for to_sq in NEIGHBOURS[from_sq]:
-                if not self.is_free(to_sq) or self.blocks[to_sq] - self.blocks[from_sq] > 1:
-                    continue
-                build_sqs = self._get_build_sq(from_sq, to_sq)
-                for build_sq in build_sqs:
+        for from_sq in self._get_worker_index():
+            buildable = ~blocked | (1 << from_sq)  # free squares plus the one being vacated
+            reach = NEIGHBOUR_BB[from_sq] & ~blocked & at_most[self.blocks[from_sq] + up]
+            if tactical_only:
+                reach &= ~at_most[self.blocks[from_sq]]  # climbs only
+            while reach:
+                lsb = reach & -reach
+                reach ^= lsb
+                to_sq = lsb.bit_length() - 1
+                mask = NEIGHBOUR_BB[to_sq] & buildable
+                while mask:
+                    lsb = mask & -mask
+                    mask ^= lsb
+                    build_sq = lsb.bit_length() - 1
                     moves.append(AthenaMove(from_sq, to_sq, build_sq))
         return moves
 
-    def _is_ally_worker(self, sq: int) -> bool:
-        return not self._is_opponent_worker(sq)
-
     from collections import deque
 
-    def _generate_moves_apollo(self):
+    def _generate_moves_apollo(self, tactical_only: bool = False):
+        blocked, at_most = self._height_masks()
+        blocks = self.blocks
+        up = 0 if self.prevent_up_next_turn else 1
+        w = self.workers
+        first = self.side << 1
+        opponents = (1 << w[2 - first]) | (1 << w[3 - first])
         moves = []
-        for from_sq in self._get_worker_index():
-            for to_sq in NEIGHBOURS[from_sq]:
-                if self.prevent_up_next_turn and self.blocks[to_sq] > self.blocks[from_sq]:
-                    continue
-                occupant = self._which_worker_is_here(to_sq)
-                if (self.blocks[to_sq] == 4 or
-                        (occupant is not None and self._is_ally_worker(occupant)) or
-                        self.blocks[to_sq] - self.blocks[from_sq] > 1):
-                    continue
-                for build_sq in NEIGHBOURS[to_sq]:
-                    if build_sq == to_sq:
-                        continue
-                    if build_sq == from_sq:
-                        if occupant is not None or self.blocks[build_sq] == 4:
-                            continue
-                    else:
-                        if not self.is_free(build_sq):
-                            continue
+        for from_sq in (w[first], w[first + 1]):
+            buildable = ~blocked | (1 << from_sq)
+            # Apollo may also step onto an opponent, who is swapped back to from_sq
+            reach = NEIGHBOUR_BB[from_sq] & (~blocked | opponents) & at_most[blocks[from_sq] + up]
+            if tactical_only:
+                reach &= ~at_most[blocks[from_sq]]  # climbs only
+            while reach:
+                lsb = reach & -reach
+                reach ^= lsb
+                to_sq = lsb.bit_length() - 1
+                if lsb & opponents:
+                    mask = NEIGHBOUR_BB[to_sq] & ~blocked
+                else:
+                    mask = NEIGHBOUR_BB[to_sq] & buildable
+                while mask:
+                    lsb = mask & -mask
+                    mask ^= lsb
+                    build_sq = lsb.bit_length() - 1
                     moves.append(ApolloMove(from_sq, to_sq, build_sq))
         return moves
 
-    def _generate_moves_artemis(self):
+    def _generate_moves_artemis(self, tactical_only: bool = False):
+        blocked, at_most = self._height_masks()
+        blocks = self.blocks
+        up = 0 if self.prevent_up_next_turn else 1
         moves, reached = [], set()
         for from_sq in self._get_worker_index():
-            for to_sq in NEIGHBOURS[from_sq]:
-                if (self.prevent_up_next_turn and self.blocks[to_sq] > self.blocks[from_sq] or
-                        not self.is_free(to_sq) or
-                        self.blocks[to_sq] - self.blocks[from_sq] > 1):
-                    continue
+            buildable = ~blocked | (1 << from_sq)
+            from_h = blocks[from_sq]
+            # Athena's restriction is relative to the starting height for both steps
+            ceiling = at_most[4] if up else at_most[from_h]
+            reach = NEIGHBOUR_BB[from_sq] & ~blocked & at_most[from_h + up]
+            # Either step may end above from_h; a level first step still leads to the second
+            keep = ~at_most[from_h] if tactical_only else -1
+            while reach:
+                lsb = reach & -reach
+                reach ^= lsb
+                to_sq = lsb.bit_length() - 1
                 reached.add((from_sq, to_sq))
-                for build_sq in self._get_build_sq(from_sq, to_sq):
+                mask = NEIGHBOUR_BB[to_sq] & buildable if lsb & keep else 0
+                while mask:
+                    lsb = mask & -mask
+                    mask ^= lsb
+                    build_sq = lsb.bit_length() - 1
                     moves.append(ArtemisMove(from_sq, to_sq, build_sq))
-                for second_sq in NEIGHBOURS[to_sq]:
-                    if (self.prevent_up_next_turn and self.blocks[second_sq] > self.blocks[from_sq] or
-                            not self.is_free(second_sq) or
-                            self.blocks[second_sq] - self.blocks[to_sq] > 1 or
-                            second_sq == from_sq or
-                            (from_sq, second_sq) in reached):
+                second = NEIGHBOUR_BB[to_sq] & ~blocked & at_most[blocks[to_sq] + 1] & ceiling & keep
+                while second:
+                    lsb = second & -second
+                    second ^= lsb
+                    second_sq = lsb.bit_length() - 1
+                    if (from_sq, second_sq) in reached:
                         continue
                     reached.add((from_sq, second_sq))
-                    for build_sq in self._get_build_sq(from_sq, second_sq):
+                    mask = NEIGHBOUR_BB[second_sq] & buildable
+                    while mask:
+                        lsb = mask & -mask
+                        mask ^= lsb
+                        build_sq = lsb.bit_length() - 1
                         moves.append(ArtemisMove(from_sq, second_sq, build_sq, mid_sq=to_sq))
         return moves
 
-    def _generate_moves_atlas(self):
+    def _generate_moves_atlas(self, tactical_only: bool = False):
+        blocked, at_most = self._height_masks()
+        up = 0 if self.prevent_up_next_turn else 1
         moves = []
         for from_sq in self._get_worker_index():
-            for to_sq in NEIGHBOURS[from_sq]:
-                if (self.prevent_up_next_turn and self.blocks[to_sq] > self.blocks[from_sq] or
-                        not self.is_free(to_sq) or
-                        self.blocks[to_sq] - self.blocks[from_sq] > 1):
-                    continue
-                for build_sq in self._get_build_sq(from_sq, to_sq):
+            buildable = ~blocked | (1 << from_sq)
+            reach = NEIGHBOUR_BB[from_sq] & ~blocked & at_most[self.blocks[from_sq] + up]
+            if tactical_only:
+                reach &= ~at_most[self.blocks[from_sq]]  # climbs only
+            while reach:
+                lsb = reach & -reach
+                reach ^= lsb
+                to_sq = lsb.bit_length() - 1
+                mask = NEIGHBOUR_BB[to_sq] & buildable
+                while mask:
+                    lsb = mask & -mask
+                    mask ^= lsb
+                    build_sq = lsb.bit_length() - 1
                     h = self.blocks[build_sq]
                     moves.append(AtlasMove(from_sq, to_sq, build_sq, False, h))
                     if h != 4:
                         moves.append(AtlasMove(from_sq, to_sq, build_sq, True, h))
         return moves
 
-    def _generate_moves_demeter(self):
+    def _generate_moves_demeter(self, tactical_only: bool = False):
+        blocked, at_most = self._height_masks()
+        up = 0 if self.prevent_up_next_turn else 1
         moves = []
         for from_sq in self._get_worker_index():
-            for to_sq in NEIGHBOURS[from_sq]:
-                if (self.prevent_up_next_turn and self.blocks[to_sq] > self.blocks[from_sq] or
-                        not self.is_free(to_sq) or
-                        self.blocks[to_sq] - self.blocks[from_sq] > 1):
-                    continue
-                build_sqs = self._get_build_sq(from_sq, to_sq)
-                for i, b1 in enumerate(build_sqs):
-                    for b2 in build_sqs[i:]:
-                        moves.append(DemeterMove(from_sq, to_sq, b1) if b1 == b2
-                                     else DemeterMove(from_sq, to_sq, b1, b2))
+            buildable = ~blocked | (1 << from_sq)
+            reach = NEIGHBOUR_BB[from_sq] & ~blocked & at_most[self.blocks[from_sq] + up]
+            if tactical_only:
+                reach &= ~at_most[self.blocks[from_sq]]  # climbs only
+            while reach:
+                lsb = reach & -reach
+                reach ^= lsb
+                to_sq = lsb.bit_length() - 1
+                mask = NEIGHBOUR_BB[to_sq] & buildable
+                while mask:
+                    lsb = mask & -mask
+                    mask ^= lsb
+                    b1 = lsb.bit_length() - 1
+                    moves.append(DemeterMove(from_sq, to_sq, b1))
+                    rest = mask
+                    while rest:
+                        lsb = rest & -rest
+                        rest ^= lsb
+                        moves.append(DemeterMove(from_sq, to_sq, b1, lsb.bit_length() - 1))
         return moves
 
-    def _generate_moves_hephaestus(self):
+    def _generate_moves_hephaestus(self, tactical_only: bool = False):
+        blocked, at_most = self._height_masks()
+        up = 0 if self.prevent_up_next_turn else 1
         moves = []
         for from_sq in self._get_worker_index():
-            for to_sq in NEIGHBOURS[from_sq]:
-                if (self.prevent_up_next_turn and self.blocks[to_sq] > self.blocks[from_sq] or
-                        not self.is_free(to_sq) or
-                        self.blocks[to_sq] - self.blocks[from_sq] > 1):
-                    continue
-                for build_sq in self._get_build_sq(from_sq, to_sq):
+            buildable = ~blocked | (1 << from_sq)
+            reach = NEIGHBOUR_BB[from_sq] & ~blocked & at_most[self.blocks[from_sq] + up]
+            if tactical_only:
+                reach &= ~at_most[self.blocks[from_sq]]  # climbs only
+            while reach:
+                lsb = reach & -reach
+                reach ^= lsb
+                to_sq = lsb.bit_length() - 1
+                mask = NEIGHBOUR_BB[to_sq] & buildable
+                while mask:
+                    lsb = mask & -mask
+                    mask ^= lsb
+                    build_sq = lsb.bit_length() - 1
                     moves.append(HephaestusMove(from_sq, to_sq, build_sq))
-                    if self.blocks[build_sq] < 2:
+                    if lsb & at_most[1]:
                         moves.append(HephaestusMove(from_sq, to_sq, build_sq, build_sq))
         return moves
 
-    def _generate_moves_pan(self):
+    def _generate_moves_pan(self, tactical_only: bool = False):
+        blocked, at_most = self._height_masks()
+        up = 0 if self.prevent_up_next_turn else 1
         moves = []
         for from_sq in self._get_worker_index():
-            for to_sq in NEIGHBOURS[from_sq]:
-                if (self.prevent_up_next_turn and self.blocks[to_sq] > self.blocks[from_sq] or
-                        not self.is_free(to_sq) or
-                        self.blocks[to_sq] - self.blocks[from_sq] > 1):
-                    continue
-                for build_sq in self._get_build_sq(from_sq, to_sq):
+            buildable = ~blocked | (1 << from_sq)
+            reach = NEIGHBOUR_BB[from_sq] & ~blocked & at_most[self.blocks[from_sq] + up]
+            if tactical_only:
+                # climbs, or drops of two or more (Pan's win)
+                h = self.blocks[from_sq]
+                reach &= ~at_most[h] | (at_most[h - 2] if h >= 2 else 0)
+            while reach:
+                lsb = reach & -reach
+                reach ^= lsb
+                to_sq = lsb.bit_length() - 1
+                mask = NEIGHBOUR_BB[to_sq] & buildable
+                while mask:
+                    lsb = mask & -mask
+                    mask ^= lsb
+                    build_sq = lsb.bit_length() - 1
                     moves.append(PanMove(from_sq, to_sq, build_sq))
         return moves
 
-    def _generate_moves_hermes(self):
+    def _generate_moves_hermes(self, tactical_only: bool = False):
+        blocked, at_most = self._height_masks()
+        up = 0 if self.prevent_up_next_turn else 1
         moves = []
         for from_sq in self._get_worker_index():
+            buildable = ~blocked | (1 << from_sq)
             h = self.blocks[from_sq]
-            for to_sq in NEIGHBOURS[from_sq]:
-                if (self.prevent_up_next_turn and self.blocks[to_sq] > h or
-                        not self.is_free(to_sq) or
-                        self.blocks[to_sq] - h > 1):
-                    continue
-                for build_sq in self._get_build_sq(from_sq, to_sq):
-                    moves.append(HermesMove(from_sq, [to_sq], build_sq))
-            for build_sq in self._get_build_sq(from_sq, from_sq):
-                moves.append(HermesMove(from_sq, [], build_sq))
-            visited, q = {from_sq}, deque([(from_sq, [])])
+            reach = NEIGHBOUR_BB[from_sq] & ~blocked & at_most[h + up]
+            if tactical_only:
+                reach &= ~at_most[h]  # climbs only
+            while reach:
+                lsb = reach & -reach
+                reach ^= lsb
+                to_sq = lsb.bit_length() - 1
+                mask = NEIGHBOUR_BB[to_sq] & buildable
+                while mask:
+                    lsb = mask & -mask
+                    mask ^= lsb
+                    build_sq = lsb.bit_length() - 1
+                    moves.append(HermesMove(from_sq, _PATH_STEP[to_sq], build_sq))
+            if tactical_only:
+                continue  # standing still or walking the level never climbs
+            mask = NEIGHBOUR_BB[from_sq] & buildable
+            while mask:
+                lsb = mask & -mask
+                mask ^= lsb
+                build_sq = lsb.bit_length() - 1
+                moves.append(HermesMove(from_sq, b'', build_sq))
+            # Squares on the worker's own level it has not walked through yet; the worker's
+            # square is blocked, so it never enters the set
+            unvisited = at_most[h] & ~blocked
+            if h:
+                unvisited &= ~at_most[h - 1]
+            q = deque([(from_sq, b'')])
             while q:
                 cur, path = q.popleft()
-                for nei in NEIGHBOURS[cur]:
-                    if (nei in visited or
-                            not self.is_free(nei) or
-                            self.blocks[nei] != h):
+                step = NEIGHBOUR_BB[cur] & unvisited
+                if not step:
+                    continue
+                unvisited ^= step
+                for nei in NEIGHBOURS_T[cur]:
+                    if not (step >> nei) & 1:
                         continue
-                    new_path = path + [nei]
-                    for build_sq in self._get_build_sq(from_sq, nei):
+                    new_path = path + _PATH_STEP[nei]
+                    mask = NEIGHBOUR_BB[nei] & buildable
+                    while mask:
+                        lsb = mask & -mask
+                        mask ^= lsb
+                        build_sq = lsb.bit_length() - 1
                         moves.append(HermesMove(from_sq, new_path, build_sq))
                     q.append((nei, new_path))
-                    visited.add(nei)
         return moves
 
-    def _generate_moves_minotaur(self):
+    def _generate_moves_minotaur(self, tactical_only: bool = False):
+        blocked, at_most = self._height_masks()
+        blocks = self.blocks
+        up = 0 if self.prevent_up_next_turn else 1
+        w = self.workers
+        first = self.side << 1
+        allies = (1 << w[first]) | (1 << w[first + 1])
         moves = []
-        for from_sq in self._get_worker_index():
-            h = self.blocks[from_sq]
-            for to_sq in NEIGHBOURS[from_sq]:
-                if self.prevent_up_next_turn and self.blocks[to_sq] > h:
-                    continue
-                occupant = self._which_worker_is_here(to_sq)
-                if occupant is not None and self._is_ally_worker(occupant):
-                    continue
-                if self.blocks[to_sq] == 4 or self.blocks[to_sq] - h > 1:
-                    continue
+        for from_sq in (w[first], w[first + 1]):
+            buildable = ~blocked | (1 << from_sq)
+            # at_most already leaves out domes and anything too high to climb
+            reach = NEIGHBOUR_BB[from_sq] & ~allies & at_most[blocks[from_sq] + up]
+            if tactical_only:
+                reach &= ~at_most[blocks[from_sq]]  # climbs only
+            while reach:
+                lsb = reach & -reach
+                reach ^= lsb
+                to_sq = lsb.bit_length() - 1
                 push_sq = None
-                if occupant is not None and self._is_opponent_worker(occupant):
-                    push_sq = _calculate_push_square(from_sq, to_sq)
-                    if (push_sq is None or
-                            not self.is_free(push_sq) or
-                            self.blocks[push_sq] == 4):
+                # reach excludes allies and domes, so a blocked square here holds an opponent
+                if lsb & blocked:
+                    push_sq = PUSH_SQ[from_sq][to_sq]
+                    if push_sq is None or (blocked >> push_sq) & 1:
                         continue
-                for build_sq in self._get_build_sq(from_sq, to_sq):
+                mask = NEIGHBOUR_BB[to_sq] & buildable
+                while mask:
+                    lsb = mask & -mask
+                    mask ^= lsb
+                    build_sq = lsb.bit_length() - 1
                     if push_sq is not None and push_sq == build_sq:
                         continue
                     moves.append(MinotaurMove(from_sq, to_sq, build_sq, push_sq is not None))
         return moves
 
-    def _generate_moves_prometheus(self):
+    def _generate_moves_prometheus(self, tactical_only: bool = False):
+        blocked, at_most = self._height_masks()
+        up = 0 if self.prevent_up_next_turn else 1
+        blocks = self.blocks
         moves = []
         for from_sq in self._get_worker_index():
-            h = self.blocks[from_sq]
-            for to_sq in NEIGHBOURS[from_sq]:
-                if (self.prevent_up_next_turn and self.blocks[to_sq] > h or
-                        not self.is_free(to_sq) or
-                        self.blocks[to_sq] - h > 1):
-                    continue
-                for build_sq in self._get_build_sq(from_sq, to_sq):
+            buildable = ~blocked | (1 << from_sq)
+            h = blocks[from_sq]
+            reach = NEIGHBOUR_BB[from_sq] & ~blocked & at_most[h + up]
+            if tactical_only:
+                reach &= ~at_most[h]  # climbs only
+            while reach:
+                lsb = reach & -reach
+                reach ^= lsb
+                to_sq = lsb.bit_length() - 1
+                mask = NEIGHBOUR_BB[to_sq] & buildable
+                while mask:
+                    lsb = mask & -mask
+                    mask ^= lsb
+                    build_sq = lsb.bit_length() - 1
                     moves.append(PrometheusMove(from_sq, to_sq, build_sq))
-            seen = set()
-            for opt in self._get_build_sq(from_sq, from_sq):
-                if self.blocks[opt] == 4:
-                    continue
-                for to_sq in NEIGHBOURS[from_sq]:
-                    if (not self.is_free(to_sq) or
-                            self.prevent_up_next_turn and self.blocks[to_sq] > h or
-                            self.blocks[to_sq] + (opt == to_sq) > h):
-                        continue
-                    for build_sq in self._get_build_sq(from_sq, to_sq):
-                        key = (from_sq, to_sq, build_sq, opt)
-                        if key in seen or (self.blocks[build_sq] == 3 and build_sq == opt):
-                            continue
-                        seen.add(key)
+            if tactical_only:
+                continue
+            # Building first means the worker may not move up at all
+            level = NEIGHBOUR_BB[from_sq] & ~blocked & at_most[h]
+            opt_mask = NEIGHBOUR_BB[from_sq] & ~blocked
+            while opt_mask:
+                lsb = opt_mask & -opt_mask
+                opt_mask ^= lsb
+                opt = lsb.bit_length() - 1
+                # the optional build raises opt, so it stays reachable only if it was below h
+                reach = level & ~lsb if blocks[opt] >= h else level
+                while reach:
+                    lsb = reach & -reach
+                    reach ^= lsb
+                    to_sq = lsb.bit_length() - 1
+                    mask = NEIGHBOUR_BB[to_sq] & buildable
+                    if blocks[opt] == 3:
+                        mask &= ~(1 << opt)  # opt became a dome
+                    while mask:
+                        lsb = mask & -mask
+                        mask ^= lsb
+                        build_sq = lsb.bit_length() - 1
                         moves.append(PrometheusMove(from_sq, to_sq, build_sq, optional_build=opt))
         return moves
 
-    def generate_moves(self):
-        god = self.gods[0] if self.turn == 1 else self.gods[1]
-
-        dispatch = {
-            God.APOLLO: self._generate_moves_apollo,
-            God.ARTEMIS: self._generate_moves_artemis,
-            God.ATHENA: self._generate_moves_athena,
-            God.ATLAS: self._generate_moves_atlas,
-            God.DEMETER: self._generate_moves_demeter,
-            God.HEPHAESTUS: self._generate_moves_hephaestus,
-            God.HERMES: self._generate_moves_hermes,
-            God.MINOTAUR: self._generate_moves_minotaur,
-            God.PAN: self._generate_moves_pan,
-            God.PROMETHEUS: self._generate_moves_prometheus,
-        }
-        raw_moves = dispatch.get(god)()
-        final_moves = []
-        for move in raw_moves:
-            move.had_athena_flag = self.prevent_up_next_turn
-            final_moves.append(move)
-        return final_moves
+    def generate_moves(self, tactical_only: bool = False):
+        """
+        Legal moves for the side to move. tactical_only keeps just the moves whose
+        worker ends higher than it started, plus Pan's drops of two or more, which are
+        the ones qsearch looks at.
+        """
+        moves = self._generators[self.side](self, tactical_only)
+        # had_athena_flag defaults to False, so only tag the moves when the flag is up
+        if self.prevent_up_next_turn:
+            for move in moves:
+                move.had_athena_flag = True
+        return moves
 
     def unmake_move(self, move: Move) -> None:
         """
@@ -883,37 +1034,18 @@ class Board:
         hash(self)
         # Flip turn back to get the player who made the move
         self.turn *= -1
-        self._xor_hash(ZOBRIST_KEYS['turn'])
-        current_player = 0 if self.turn == 1 else 1
-        god = self.gods[current_player]
+        self.side ^= 1
+        self._hash ^= zobrist_turn
+        god = self.gods[self.side]
 
-        if move.god != god:
+        if move.god is not god:
             raise Exception(f"Move god {move.god} does not match current god {god}")
 
-        # Now dispatch undo using the god field:
-        god_undo_handlers = {
-            God.APOLLO: self._undo_apollo_move,
-            God.ARTEMIS: self._undo_artemis_move,
-            God.ATHENA: self._undo_athena_move,
-            God.ATLAS: self._undo_atlas_move,
-            God.DEMETER: self._undo_demeter_move,
-            God.HEPHAESTUS: self._undo_hephaestus_move,
-            God.HERMES: self._undo_hermes_move,
-            God.MINOTAUR: self._undo_minotaur_move,
-            God.PAN: self._undo_pan_move,
-            God.PROMETHEUS: self._undo_prometheus_move,
-        }
-
-        undo_fn = god_undo_handlers.get(god)
-        if undo_fn is None:
-            raise Exception(f"No undo handler for god {god}")
-        if undo_fn is None:
-            raise Exception(f"No undo function for move type {type(move).__name__}")
-
         self.won = False
-        if self.prevent_up_next_turn != move.had_athena_flag: self._xor_hash(ZOBRIST_KEYS["athena"])
-        self.prevent_up_next_turn = move.had_athena_flag
-        undo_fn(move)
+        if self._athena_in_game or self.prevent_up_next_turn or move.had_athena_flag:
+            if self.prevent_up_next_turn != move.had_athena_flag: self._hash ^= athena
+            self.prevent_up_next_turn = move.had_athena_flag
+        self._undoers[self.side](self, move)
 
     # ------------------------------------------------------------------------
     #                            Helper Methods
@@ -931,16 +1063,16 @@ class Board:
 
     def _move_worker_back(self, wi: int, from_sq: int) -> None:
         player = _player_of_worker(wi)
-        self._xor_hash(ZOBRIST_KEYS["workers"][self.workers[wi]][player])
-        self._xor_hash(ZOBRIST_KEYS["workers"][from_sq][player])
+        self._hash ^= zobrist_workers[self.workers[wi]][player]
+        self._hash ^= zobrist_workers[from_sq][player]
         self.workers[wi] = from_sq
 
     def _decrement_block(self, sq: int) -> None:
         h = self.blocks[sq]
-        self._xor_hash(ZOBRIST_KEYS["blocks"][sq][h - 1])
+        self._hash ^= zobrist_blocks[sq][h - 1]
         self.blocks[sq] -= 1
         if self.blocks[sq] > 0:
-            self._xor_hash(ZOBRIST_KEYS["blocks"][sq][self.blocks[sq] - 1])
+            self._hash ^= zobrist_blocks[sq][self.blocks[sq] - 1]
 
     def _decrement_blocks(self, build_squares: list[int]) -> None:
         """
@@ -952,10 +1084,10 @@ class Board:
     def _restore_block_height(self, sq: int, orig_h: int) -> None:
         current_h = self.blocks[sq]
         if current_h > 0:
-            self._xor_hash(ZOBRIST_KEYS["blocks"][sq][current_h - 1])
+            self._hash ^= zobrist_blocks[sq][current_h - 1]
         self.blocks[sq] = orig_h
         if orig_h > 0:
-            self._xor_hash(ZOBRIST_KEYS["blocks"][sq][orig_h - 1])
+            self._hash ^= zobrist_blocks[sq][orig_h - 1]
 
     def _undo_opponent_push(self, from_sq: int, to_sq: int) -> None:
         """
@@ -963,7 +1095,7 @@ class Board:
         This function computes push_sq, sees if there's an opponent there, and moves
         them back from push_sq to 'to_sq'.
         """
-        push_sq = _calculate_push_square(from_sq, to_sq)
+        push_sq = PUSH_SQ[from_sq][to_sq]
         opp_index = self._which_worker_is_here(push_sq)
         if opp_index is not None and self._is_opponent_worker(opp_index):
             self._move_worker_back(opp_index, to_sq)
@@ -979,8 +1111,8 @@ class Board:
         opp_index = self._which_worker_is_here(move.from_sq)
         if opp_index is not None and self._is_opponent_worker(opp_index):
             opp_player = _player_of_worker(opp_index)
-            self._xor_hash(ZOBRIST_KEYS["workers"][move.from_sq][opp_player])
-            self._xor_hash(ZOBRIST_KEYS["workers"][move.to_sq][opp_player])
+            self._hash ^= zobrist_workers[move.from_sq][opp_player]
+            self._hash ^= zobrist_workers[move.to_sq][opp_player]
             self.workers[opp_index] = move.to_sq
         self._move_worker_back(active_worker, move.from_sq)
 
@@ -993,7 +1125,6 @@ class Board:
         self._decrement_block(move.build_sq)
         active_worker = self._find_active_worker_undo(move.to_sq)
         self._move_worker_back(active_worker, move.from_sq)
-        self.prevent_up_next_turn = False
         self.last_move_height_diff = 0
 
     def _undo_atlas_move(self, move: AtlasMove) -> None:
@@ -1041,3 +1172,58 @@ class Board:
         if move.optional_build is not None:
             self._decrement_block(move.optional_build)
 
+
+###############################################################################
+# per-god dispatch tables (bound per side by Board._bind_god_handlers)
+###############################################################################
+_GENERATORS = {
+    God.APOLLO: Board._generate_moves_apollo,
+    God.ARTEMIS: Board._generate_moves_artemis,
+    God.ATHENA: Board._generate_moves_athena,
+    God.ATLAS: Board._generate_moves_atlas,
+    God.DEMETER: Board._generate_moves_demeter,
+    God.HEPHAESTUS: Board._generate_moves_hephaestus,
+    God.HERMES: Board._generate_moves_hermes,
+    God.MINOTAUR: Board._generate_moves_minotaur,
+    God.PAN: Board._generate_moves_pan,
+    God.PROMETHEUS: Board._generate_moves_prometheus,
+}
+
+_MAKERS = {
+    God.APOLLO: Board._apollo_make_move,
+    God.ARTEMIS: Board._artemis_make_move,
+    God.ATHENA: Board._athena_make_move,
+    God.ATLAS: Board._atlas_make_move,
+    God.DEMETER: Board._demeter_make_move,
+    God.HEPHAESTUS: Board._hephaestus_make_move,
+    God.HERMES: Board._hermes_make_move,
+    God.MINOTAUR: Board._minotaur_make_move,
+    God.PAN: Board._pan_make_move,
+    God.PROMETHEUS: Board._prometheus_make_move,
+}
+
+_UNDOERS = {
+    God.APOLLO: Board._undo_apollo_move,
+    God.ARTEMIS: Board._undo_artemis_move,
+    God.ATHENA: Board._undo_athena_move,
+    God.ATLAS: Board._undo_atlas_move,
+    God.DEMETER: Board._undo_demeter_move,
+    God.HEPHAESTUS: Board._undo_hephaestus_move,
+    God.HERMES: Board._undo_hermes_move,
+    God.MINOTAUR: Board._undo_minotaur_move,
+    God.PAN: Board._undo_pan_move,
+    God.PROMETHEUS: Board._undo_prometheus_move,
+}
+
+_VALIDATORS = {
+    God.APOLLO: Board._apollo_move_is_valid,
+    God.ARTEMIS: Board._artemis_move_is_valid,
+    God.ATHENA: Board._athena_move_is_valid,
+    God.ATLAS: Board._atlas_move_is_valid,
+    God.DEMETER: Board._demeter_move_is_valid,
+    God.HEPHAESTUS: Board._hephaestus_move_is_valid,
+    God.HERMES: Board._hermes_move_is_valid,
+    God.MINOTAUR: Board._minotaur_move_is_valid,
+    God.PAN: Board._pan_move_is_valid,
+    God.PROMETHEUS: Board._prometheus_move_is_valid,
+}
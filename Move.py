@@ -1,281 +1,312 @@
-from abc import ABC, abstractmethod
-from typing import Type, TypeVar, List, Optional
-from dataclasses import dataclass, field
+from typing import Type, TypeVar, List, Optional, Union
 
 from constants import God  # e.g. God.APOLLO, God.ARTEMIS, etc.
 
+# Square names ("a1".."e5") and their indices, built once so conversions are a single lookup
+SQUARE_TEXT = tuple(chr(ord('a') + sq % 5) + str(sq // 5 + 1) for sq in range(25))
+TEXT_SQUARE = {text: sq for sq, text in enumerate(SQUARE_TEXT)}
+
 def text_to_square(square_text):
-    row = ord(square_text[0]) - ord('a')
-    col = int(square_text[1]) - 1
-    square = col * 5 + row
-    if square < 0 or square > 24:
-        raise Exception(f"Invalid square: {square_text}")
-    return square
+    try:
+        return TEXT_SQUARE[square_text]
+    except KeyError:
+        raise Exception(f"Invalid square: {square_text}") from None
+
+# bytes.translate table: 'a'..'e' and '1'..'5' -> 0..4, anything else -> 255
+_SQUARE_CHAR = bytearray([255]) * 256
+for _i in range(5):
+    _SQUARE_CHAR[ord('a') + _i] = _i
+    _SQUARE_CHAR[ord('1') + _i] = _i
+_SQUARE_CHAR = bytes(_SQUARE_CHAR)
+
+def text_to_squares(move_text: str) -> List[int]:
+    """Split move text into its two-character squares."""
+    raw = move_text.encode('ascii', 'replace').translate(_SQUARE_CHAR)
+    if len(raw) & 1 or 255 in raw:
+        # slow path, only to raise on the offending square
+        return [text_to_square(move_text[i:i + 2]) for i in range(0, len(move_text), 2)]
+    return [rank * 5 + file for file, rank in zip(raw[0::2], raw[1::2])]
 
 def square_to_text(square):
-    row = chr(square % 5 + ord('a'))
-    col = str(square // 5 + 1)
-    return row + col
+    return SQUARE_TEXT[square]
 
 T = TypeVar('T', bound='Move')
 
-@dataclass
-class Move(ABC):
-    from_sq: int
-    had_athena_flag: bool = field(default=False, init=False)
-    score: int = field(init=False, default=0)
-    god: Optional[God] = field(init=False, default=None)
+class Move:
+    # Plain slotted classes with hand-written __init__s: moves are built by the
+    # thousand in search and the dataclass __init__ + __post_init__ pair was ~1.7x slower.
+    # god is a class attribute, so construction never writes it.
+    __slots__ = ('from_sq', 'final_sq', 'had_athena_flag', 'score')
+    god: Optional[God] = None
+
+    def __init__(self, from_sq: int):
+        self.from_sq = from_sq
+        self.final_sq = from_sq
+        self.had_athena_flag = False
+        self.score = 0
 
-    @property
-    @abstractmethod
-    def final_sq(self) -> int:
-        pass
+    def __repr__(self) -> str:
+        names = [name for klass in reversed(type(self).__mro__) for name in getattr(klass, '__slots__', ())]
+        return f"{type(self).__name__}({', '.join(f'{name}={getattr(self, name)!r}' for name in names)})"
 
-    @abstractmethod
     def to_text(self) -> str:
-        pass
+        raise NotImplementedError
+
+    def code(self) -> int:
+        """
+        The move packed into a small int, 5 bits per square (optional squares stored +1,
+        so 0 means absent). Two moves of the same god are the same move iff their codes
+        match; cheaper to compare than to_text.
+        """
+        raise NotImplementedError
+
+    # Field names in text order for each accepted text length. Subclasses whose
+    # text is just a run of squares only need to fill this in to get from_text.
+    _text_layouts = {}
+    _text_error = "Move text has an invalid length"
+    _parsers = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # One parser per text length, built once: each maps the squares straight onto
+        # the positional __init__ arguments instead of going through keyword dicts.
+        code = cls.__init__.__code__
+        params = code.co_varnames[1:code.co_argcount]
+        cls._parsers = {
+            length: _positional_parser(cls, tuple(fields.index(name) for name in params if name in fields))
+            for length, fields in cls._text_layouts.items()
+        }
 
     @classmethod
-    @abstractmethod
     def from_text(cls: Type[T], move_text: str) -> T:
-        pass
+        parser = cls._parsers.get(len(move_text))
+        if parser is None:
+            raise ValueError(cls._text_error)
+        return parser(move_text)
+
+def _positional_parser(cls, order):
+    """Parser for one text layout; order[i] is the text position of __init__'s i-th square."""
+    # Generated as straight-line code, one dict lookup per square: ~2x faster than
+    # splitting the text and reordering a list. Bad squares fall back to
+    # text_to_squares for the usual error.
+    args = ', '.join(f'_SQ[move_text[{2 * i}:{2 * i + 2}]]' for i in order)
+    source = (
+        'def parse(move_text):\n'
+        '    try:\n'
+        f'        return cls({args})\n'
+        '    except KeyError:\n'
+        '        text_to_squares(move_text)\n'
+        '        raise\n'
+    )
+    namespace = {'cls': cls, '_SQ': TEXT_SQUARE, 'text_to_squares': text_to_squares}
+    exec(source, namespace)
+    return namespace['parse']
 
 # --- ApolloMove ---
-@dataclass
 class ApolloMove(Move):
-    to_sq: int
-    build_sq: int
+    __slots__ = ('to_sq', 'build_sq')
+    god = God.APOLLO
 
-    def __post_init__(self):
-        self.god = God.APOLLO
-
-    @property
-    def final_sq(self) -> int:
-        return self.to_sq
+    def __init__(self, from_sq: int, to_sq: int, build_sq: int):
+        self.from_sq = from_sq
+        self.to_sq = to_sq
+        self.final_sq = to_sq  # where the worker ends up, stored since search reads it per move
+        self.build_sq = build_sq
+        self.had_athena_flag = False
+        self.score = 0
 
     def to_text(self) -> str:
-        return square_to_text(self.from_sq) + square_to_text(self.to_sq) + square_to_text(self.build_sq)
+        return SQUARE_TEXT[self.from_sq] + SQUARE_TEXT[self.to_sq] + SQUARE_TEXT[self.build_sq]
 
-    @classmethod
-    def from_text(cls, move_text: str) -> "ApolloMove":
-        return cls(
-            from_sq=text_to_square(move_text[0:2]),
-            to_sq=text_to_square(move_text[2:4]),
-            build_sq=text_to_square(move_text[4:6]),
-        )
+    def code(self) -> int:
+        return self.from_sq | self.to_sq << 5 | self.build_sq << 10
+
+    _text_layouts = {6: ("from_sq", "to_sq", "build_sq")}
+    _text_error = "Move text must be 6 characters long"
 
 # --- ArtemisMove ---
-@dataclass
 class ArtemisMove(Move):
-    to_sq: int
-    build_sq: int
-    mid_sq: Optional[int] = None
-
-    def __post_init__(self):
-        self.god = God.ARTEMIS
-
-    @property
-    def final_sq(self) -> int:
-        return self.to_sq
+    __slots__ = ('to_sq', 'build_sq', 'mid_sq')
+    god = God.ARTEMIS
+
+    def __init__(self, from_sq: int, to_sq: int, build_sq: int, mid_sq: Optional[int] = None):
+        self.from_sq = from_sq
+        self.to_sq = to_sq
+        self.final_sq = to_sq
+        self.build_sq = build_sq
+        self.mid_sq = mid_sq
+        self.had_athena_flag = False
+        self.score = 0
 
     def to_text(self) -> str:
-        parts = [square_to_text(self.from_sq)]
+        text = SQUARE_TEXT[self.to_sq] + SQUARE_TEXT[self.build_sq]
         if self.mid_sq is not None:
-            parts.append(square_to_text(self.mid_sq))
-        parts.append(square_to_text(self.to_sq))
-        parts.append(square_to_text(self.build_sq))
-        return ''.join(parts)
+            return SQUARE_TEXT[self.from_sq] + SQUARE_TEXT[self.mid_sq] + text
+        return SQUARE_TEXT[self.from_sq] + text
 
-    @classmethod
-    def from_text(cls, move_text: str) -> "ArtemisMove":
-        if len(move_text) == 6:
-            return cls(
-                from_sq=text_to_square(move_text[0:2]),
-                to_sq=text_to_square(move_text[2:4]),
-                build_sq=text_to_square(move_text[4:6]),
-            )
-        elif len(move_text) == 8:
-            return cls(
-                from_sq=text_to_square(move_text[0:2]),
-                mid_sq=text_to_square(move_text[2:4]),
-                to_sq=text_to_square(move_text[4:6]),
-                build_sq=text_to_square(move_text[6:8]),
-            )
-        else:
-            raise ValueError("Move text must be 6 or 8 characters long")
+    def code(self) -> int:
+        mid = 0 if self.mid_sq is None else self.mid_sq + 1
+        return self.from_sq | self.to_sq << 5 | self.build_sq << 10 | mid << 15
+
+    _text_layouts = {
+        6: ("from_sq", "to_sq", "build_sq"),
+        8: ("from_sq", "mid_sq", "to_sq", "build_sq"),
+    }
+    _text_error = "Move text must be 6 or 8 characters long"
 
 # --- HermesMove ---
-@dataclass
 class HermesMove(Move):
-    squares: List[int]
-    build_sq: int
-
-    def __post_init__(self):
-        self.god = God.HERMES
-
-    @property
-    def final_sq(self) -> int:
-        return self.squares[-1] if self.squares else self.from_sq
+    __slots__ = ('squares', 'build_sq')
+    god = God.HERMES
+
+    def __init__(self, from_sq: int, squares: Union[bytes, List[int]], build_sq: int):
+        self.from_sq = from_sq
+        # one byte per square; immutable, so the generator can share a path between moves
+        self.squares = squares if squares.__class__ is bytes else bytes(squares)
+        self.final_sq = squares[-1] if squares else from_sq
+        self.build_sq = build_sq
+        self.had_athena_flag = False
+        self.score = 0
 
     def to_text(self) -> str:
         return (
-            square_to_text(self.from_sq) +
-            ''.join(square_to_text(sq) for sq in self.squares) +
-            square_to_text(self.build_sq)
+            SQUARE_TEXT[self.from_sq] +
+            ''.join([SQUARE_TEXT[sq] for sq in self.squares]) +
+            SQUARE_TEXT[self.build_sq]
         )
 
+    def code(self) -> int:
+        # paths vary in length, so squares follow the two fixed fields (+1 keeps a0 distinct from "no square")
+        code = self.from_sq | self.build_sq << 5
+        shift = 10
+        for sq in self.squares:
+            code |= (sq + 1) << shift
+            shift += 5
+        return code
+
     @classmethod
     def from_text(cls, move_text: str) -> "HermesMove":
         if len(move_text) < 4 or len(move_text) % 2 != 0:
             raise ValueError("Hermes move text must be even and at least 4 chars")
-        from_sq = text_to_square(move_text[0:2])
-        build_sq = text_to_square(move_text[-2:])
-        middle = move_text[2:-2]
-        squares = [text_to_square(middle[i:i+2]) for i in range(0, len(middle), 2)]
-        return cls(from_sq=from_sq, squares=squares, build_sq=build_sq)
+        squares = text_to_squares(move_text)
+        return cls(from_sq=squares[0], squares=bytes(squares[1:-1]), build_sq=squares[-1])
 
 # --- DemeterMove ---
-@dataclass
 class DemeterMove(Move):
-    to_sq: int
-    build_sq_1: int
-    build_sq_2: Optional[int] = None
-
-    def __post_init__(self):
-        self.god = God.DEMETER
-
-    @property
-    def final_sq(self) -> int:
-        return self.to_sq
+    __slots__ = ('to_sq', 'build_sq_1', 'build_sq_2')
+    god = God.DEMETER
+
+    def __init__(self, from_sq: int, to_sq: int, build_sq_1: int, build_sq_2: Optional[int] = None):
+        self.from_sq = from_sq
+        self.to_sq = to_sq
+        self.final_sq = to_sq
+        self.build_sq_1 = build_sq_1
+        self.build_sq_2 = build_sq_2
+        self.had_athena_flag = False
+        self.score = 0
 
     def to_text(self) -> str:
-        parts = [
-            square_to_text(self.from_sq),
-            square_to_text(self.to_sq),
-            square_to_text(self.build_sq_1),
-        ]
+        text = SQUARE_TEXT[self.from_sq] + SQUARE_TEXT[self.to_sq] + SQUARE_TEXT[self.build_sq_1]
         if self.build_sq_2 is not None:
-            parts.append(square_to_text(self.build_sq_2))
-        return ''.join(parts)
+            return text + SQUARE_TEXT[self.build_sq_2]
+        return text
 
-    @classmethod
-    def from_text(cls, move_text: str) -> "DemeterMove":
-        if len(move_text) == 6:
-            return cls(
-                from_sq=text_to_square(move_text[0:2]),
-                to_sq=text_to_square(move_text[2:4]),
-                build_sq_1=text_to_square(move_text[4:6]),
-            )
-        elif len(move_text) == 8:
-            return cls(
-                from_sq=text_to_square(move_text[0:2]),
-                to_sq=text_to_square(move_text[2:4]),
-                build_sq_1=text_to_square(move_text[4:6]),
-                build_sq_2=text_to_square(move_text[6:8]),
-            )
-        else:
-            raise ValueError("Demeter move text must be 6 or 8 characters")
+    def code(self) -> int:
+        second = 0 if self.build_sq_2 is None else self.build_sq_2 + 1
+        return self.from_sq | self.to_sq << 5 | self.build_sq_1 << 10 | second << 15
+
+    _text_layouts = {
+        6: ("from_sq", "to_sq", "build_sq_1"),
+        8: ("from_sq", "to_sq", "build_sq_1", "build_sq_2"),
+    }
+    _text_error = "Demeter move text must be 6 or 8 characters"
 
 # --- HephaestusMove ---
-@dataclass
 class HephaestusMove(DemeterMove):
-    def __post_init__(self):
-        self.god = God.HEPHAESTUS
+    __slots__ = ()
+    god = God.HEPHAESTUS
 
 # --- PanMove ---
-@dataclass
 class PanMove(ApolloMove):
-    def __post_init__(self):
-        self.god = God.PAN
+    __slots__ = ()
+    god = God.PAN
 
 # --- PrometheusMove ---
-@dataclass
 class PrometheusMove(Move):
-    to_sq: int
-    build_sq: int
-    optional_build: Optional[int] = None
-
-    def __post_init__(self):
-        self.god = God.PROMETHEUS
-
-    @property
-    def final_sq(self) -> int:
-        return self.to_sq
+    __slots__ = ('to_sq', 'build_sq', 'optional_build')
+    god = God.PROMETHEUS
+
+    def __init__(self, from_sq: int, to_sq: int, build_sq: int, optional_build: Optional[int] = None):
+        self.from_sq = from_sq
+        self.to_sq = to_sq
+        self.final_sq = to_sq
+        self.build_sq = build_sq
+        self.optional_build = optional_build
+        self.had_athena_flag = False
+        self.score = 0
 
     def to_text(self) -> str:
-        parts = [
-            square_to_text(self.from_sq),
-            square_to_text(self.to_sq),
-            square_to_text(self.build_sq),
-        ]
+        text = SQUARE_TEXT[self.from_sq] + SQUARE_TEXT[self.to_sq] + SQUARE_TEXT[self.build_sq]
         if self.optional_build is not None:
-            parts.append(square_to_text(self.optional_build))
-        return ''.join(parts)
+            return text + SQUARE_TEXT[self.optional_build]
+        return text
 
-    @classmethod
-    def from_text(cls, move_text: str) -> "PrometheusMove":
-        if len(move_text) == 6:
-            return cls(
-                from_sq=text_to_square(move_text[0:2]),
-                to_sq=text_to_square(move_text[2:4]),
-                build_sq=text_to_square(move_text[4:6]),
-            )
-        elif len(move_text) == 8:
-            return cls(
-                from_sq=text_to_square(move_text[0:2]),
-                to_sq=text_to_square(move_text[2:4]),
-                build_sq=text_to_square(move_text[4:6]),
-                optional_build=text_to_square(move_text[6:8]),
-            )
-        else:
-            raise ValueError("Prometheus move text must be 6 or 8 characters")
+    def code(self) -> int:
+        optional = 0 if self.optional_build is None else self.optional_build + 1
+        return self.from_sq | self.to_sq << 5 | self.build_sq << 10 | optional << 15
+
+    _text_layouts = {
+        6: ("from_sq", "to_sq", "build_sq"),
+        8: ("from_sq", "to_sq", "build_sq", "optional_build"),
+    }
+    _text_error = "Prometheus move text must be 6 or 8 characters"
 
 # --- AthenaMove ---
-@dataclass
 class AthenaMove(ApolloMove):
-    def __post_init__(self):
-        self.god = God.ATHENA
+    __slots__ = ()
+    god = God.ATHENA
 
 # --- MinotaurMove ---
-@dataclass
 class MinotaurMove(ApolloMove):
-    pushed: bool = False
-
-    def __post_init__(self):
-        self.god = God.MINOTAUR
+    __slots__ = ('pushed',)
+    god = God.MINOTAUR
+
+    def __init__(self, from_sq: int, to_sq: int, build_sq: int, pushed: bool = False):
+        self.from_sq = from_sq
+        self.to_sq = to_sq
+        self.final_sq = to_sq
+        self.build_sq = build_sq
+        self.pushed = pushed
+        self.had_athena_flag = False
+        self.score = 0
 
 # --- AtlasMove ---
-@dataclass
 class AtlasMove(Move):
-    to_sq: int
-    build_sq: int
-    dome: bool
-    orig_h: Optional[int] = None
-
-    def __post_init__(self):
-        self.god = God.ATLAS
-
-    @property
-    def final_sq(self) -> int:
-        return self.to_sq
+    __slots__ = ('to_sq', 'build_sq', 'dome', 'orig_h')
+    god = God.ATLAS
+
+    def __init__(self, from_sq: int, to_sq: int, build_sq: int, dome: bool, orig_h: Optional[int] = None):
+        self.from_sq = from_sq
+        self.to_sq = to_sq
+        self.final_sq = to_sq
+        self.build_sq = build_sq
+        self.dome = dome
+        self.orig_h = orig_h
+        self.had_athena_flag = False
+        self.score = 0
 
     def to_text(self) -> str:
-        parts = [
-            square_to_text(self.from_sq),
-            square_to_text(self.to_sq),
-            square_to_text(self.build_sq),
-        ]
-        if self.dome:
-            parts.append("D")
-        return ''.join(parts)
+        text = SQUARE_TEXT[self.from_sq] + SQUARE_TEXT[self.to_sq] + SQUARE_TEXT[self.build_sq]
+        return text + "D" if self.dome else text
+
+    def code(self) -> int:
+        return self.from_sq | self.to_sq << 5 | self.build_sq << 10 | self.dome << 15
 
     @classmethod
     def from_text(cls, move_text: str) -> "AtlasMove":
         if len(move_text) not in (6, 7):
             raise ValueError("Atlas move must be 6 or 7 characters")
-        from_sq = text_to_square(move_text[0:2])
-        to_sq = text_to_square(move_text[2:4])
-        build_sq = text_to_square(move_text[4:6])
+        from_sq, to_sq, build_sq = text_to_squares(move_text[:6])
         dome = len(move_text) == 7 and move_text[6] == "D"
         if len(move_text) == 7 and not dome:
             raise ValueError("Atlas 7th char must be 'D' if present.")
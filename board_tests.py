@@ -1,3 +1,4 @@
+import random
 import unittest
 
 from Board import Board
@@ -12,6 +13,9 @@ from Move import (
 #                        HELPER FUNCTIONS / DEFINITIONS
 ###############################################################################
 
+# Position-string digit for each god
+_GOD_CHAR = {god: str(god.value) for god in God}
+
 def make_position(
     blocks,        # list of 25 integers in [0..4]
     gray_workers,  # tuple of 2 squares for Gray
@@ -32,34 +36,24 @@ def make_position(
     # Validate input quickly
     if len(blocks) != 25:
         raise ValueError("blocks must have length 25")
-    for b in blocks:
-        if not (0 <= b <= 4):
-            raise ValueError("Invalid block height, must be 0..4")
-    # Build the first 50 chars
-    position_chars = []
-    for sq in range(25):
-        # block height
-        h = blocks[sq]
-        # worker code
-        if sq == gray_workers[0] or sq == gray_workers[1]:
-            w = 'G'
-        elif sq == blue_workers[0] or sq == blue_workers[1]:
-            w = 'B'
-        else:
-            w = 'N'
-        position_chars.append(str(h))
-        position_chars.append(w)
+    if not all(0 <= b <= 4 for b in blocks):
+        raise ValueError("Invalid block height, must be 0..4")
+    # Worker codes by square; gray is written last so it wins a shared square, as before
+    codes = ['N'] * 25
+    codes[blue_workers[0]] = codes[blue_workers[1]] = 'B'
+    codes[gray_workers[0]] = codes[gray_workers[1]] = 'G'
 
     # Turn: '0' => Gray, '1' => Blue
-    turn_char = '0' if turn == 1 else '1'
-    # Convert gods
-    god_gray_char = str(god_gray.value)
-    god_blue_char = str(god_blue.value)
-
-    athena_up = '1' if athena_up else '0'
+    return (
+        ''.join([f"{h}{w}" for h, w in zip(blocks, codes)]) +
+        ('0' if turn == 1 else '1') +
+        _GOD_CHAR[god_gray] + _GOD_CHAR[god_blue] +
+        ('1' if athena_up else '0')
+    )
 
-    return ''.join(position_chars) + turn_char + god_gray_char + god_blue_char + athena_up
 
+# Default heights for create_board; make_position only reads them
+_ZERO_BLOCKS = (0,) * 25
 
 def create_board(
     blocks=None,
@@ -74,11 +68,8 @@ def create_board(
     By default, everything is set to minimal valid (all blocks=0,
     workers in squares 0,1,23,24, Gray=APOLLO, Blue=ARTEMIS).
     """
-    if blocks is None:
-        blocks = [0]*25
-
     pos_str = make_position(
-        blocks,
+        _ZERO_BLOCKS if blocks is None else blocks,
         gray_workers,
         blue_workers,
         turn,
@@ -93,7 +84,7 @@ def moves_equal(m1: Move, m2: Move) -> bool:
     Helper to compare two Move objects quickly if needed.
     (Only works if they're the same type and have same squares.)
     """
-    if type(m1) != type(m2):
+    if m1.__class__ is not m2.__class__:
         return False
     return (
         m1.from_sq == m2.from_sq and
@@ -825,6 +816,30 @@ class TestBoardHashing(unittest.TestCase):
         b2.prevent_up_next_turn = True
         self.assertNotEqual(hash(b1), hash(b2))
 
+    def test_athena_flag_set_without_athena_is_cleared_and_hashed(self):
+        """A flag raised by hand in a game without Athena still goes through make/unmake."""
+        board = create_board(god_gray=God.APOLLO, god_blue=God.ARTEMIS)
+        board.prevent_up_next_turn = True
+        start_hash = hash(board)
+        move = board.generate_moves()[0]
+        board.make_move(move)
+        self.assertFalse(board.prevent_up_next_turn)
+        self.assertEqual(hash(board), hash(Board(board.position_to_text())))
+        board.unmake_move(move)
+        self.assertTrue(board.prevent_up_next_turn)
+        self.assertEqual(hash(board), start_hash)
+
+    def test_clone_is_independent(self):
+        b1 = Board(POS_1)
+        b2 = b1.clone()
+        self.assertEqual(b1.position_to_text(), b2.position_to_text())
+        self.assertEqual(hash(b1), hash(b2))
+        move = b2.generate_moves()[0]
+        b2.make_move(move)
+        self.assertEqual(b1.position_to_text(), POS_1)
+        b2.unmake_move(move)
+        self.assertEqual(hash(b1), hash(b2))
+
     @staticmethod
     def _stress_scenarios():
         """Return a list of boards that exercise each god’s tricky case."""
@@ -864,6 +879,10 @@ class TestBoardHashing(unittest.TestCase):
 
             # Prometheus build‑before‑move
             create_board(god_gray=God.PROMETHEUS, god_blue=God.APOLLO),
+
+            # Athena mirror with the 'up' flag already set by the opponent
+            Board(make_position([0] * 25, (0, 10), (23, 24), 1,
+                                God.ATHENA, God.ATHENA, athena_up=True)),
         ]
 
     def test_hash_consistent_after_make_unmake(self):
@@ -918,6 +937,33 @@ class TestGeneratedMovesAreValid(unittest.TestCase):
             for move in board.generate_moves():
                 self.assertTrue(board.move_is_valid(move), f"{board.gods[0].name}/{board.gods[1].name} invalid move {move}")
 
+
+class TestTacticalMoves(unittest.TestCase):
+    def test_tactical_moves_are_the_climbs_of_the_full_list(self):
+        """
+        generate_moves(tactical_only=True) must equal the full list filtered to
+        climbs (plus Pan's drops of two or more), in the same order, for every god
+        pair along a few random games.
+        """
+        rng = random.Random(0)
+        for god_gray in God:
+            for god_blue in God:
+                board = create_board(god_gray=god_gray, god_blue=god_blue)
+                for _ in range(30):
+                    moves = board.generate_moves()
+                    if not moves or board.check_state():
+                        break
+                    is_pan = board.gods[board.side] is God.PAN
+                    blocks = board.blocks
+                    expected = [
+                        m.code() for m in moves
+                        if blocks[m.final_sq] > blocks[m.from_sq]
+                        or (is_pan and blocks[m.from_sq] - blocks[m.final_sq] >= 2)
+                    ]
+                    tactical = [m.code() for m in board.generate_moves(tactical_only=True)]
+                    self.assertEqual(tactical, expected, f"{god_gray.name}/{god_blue.name} at {board.position_to_text()}")
+                    board.make_move(rng.choice(moves))
+
 ###############################################################################
 #                                RUN TESTS
 ###############################################################################
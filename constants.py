@@ -27,6 +27,10 @@ NEIGHBOURS = [
     {17, 18, 19, 22, 24},
     {18, 19, 23}
 ]
+# NEIGHBOURS (sets) stays the membership-test form; the loops iterate these tuples,
+# which is cheaper than iterating a set, and bit-twiddling code uses the masks.
+NEIGHBOURS_T = tuple(tuple(n) for n in NEIGHBOURS)
+NEIGHBOUR_BB = tuple(sum(1 << n for n in neighbours) for neighbours in NEIGHBOURS)
 DOUBLE_NEIGHBORS = [
     9,  12, 15, 12,  9,
     12, 16, 20, 16, 12,
@@ -122,3 +126,16 @@ class God(Enum):
     MINOTAUR = 7
     PAN = 8
     PROMETHEUS = 9
+
+# Plain module-level aliases of the members: `God.PAN` goes through the Enum
+# class attribute machinery on every access, which shows up in hot loops.
+APOLLO = God.APOLLO
+ARTEMIS = God.ARTEMIS
+ATHENA = God.ATHENA
+ATLAS = God.ATLAS
+DEMETER = God.DEMETER
+HEPHAESTUS = God.HEPHAESTUS
+HERMES = God.HERMES
+MINOTAUR = God.MINOTAUR
+PAN = God.PAN
+PROMETHEUS = God.PROMETHEUS
@@ -1,5 +1,5 @@
 from Board import Board
-from constants import NEIGHBOURS
+from constants import NEIGHBOURS_T
 
 POS_GAPS = [0, 1, 2, 1, 0,
             1, 2, 3, 2, 1,
@@ -7,7 +7,30 @@ POS_GAPS = [0, 1, 2, 1, 0,
             1, 2, 3, 2, 1,
             0, 1, 2, 1, 2]
 
+TEMPO = 50
+
+# A worker's free neighbours are tallied into one int key: 1 per same-height square,
+# 9 per one-up, 81 per one-down and 729 per two-up (a square has at most 8 neighbours,
+# so the digits never carry). NEIGHBOUR_WEIGHT[height][h] is the increment for a free
+# neighbour of height h; domes and other heights add nothing.
+SAME_W, NEXT_W, PREV_W, NEXT_NEXT_W = 1, 9, 81, 729
+NEIGHBOUR_WEIGHT = tuple(
+    tuple(
+        SAME_W if h == height else
+        NEXT_W if h == height + 1 and h < 4 else
+        PREV_W if h == height - 1 else
+        NEXT_NEXT_W if h == height + 2 and h < 4 else 0
+        for h in range(5)
+    )
+    for height in range(4)
+)
+
 class Parameters:
+    __slots__ = (
+        'posScore', 'heightScore', 'sameHeightSupport', 'nextHeightSupport', 'prevHeightSupport',
+        'nextNextHeightSupport', 'support', 'score',
+    )
+
     def __init__(self, centrality_gap, h2_gap, sh1, sh2, nh1, nh2, ph1, ph2, nn1, nn2):
         self.posScore = [centrality_gap * x for x in POS_GAPS]
         self.heightScore = [0, 100, h2_gap + 100, h2_gap + 50]
@@ -15,43 +38,20 @@ class Parameters:
         self.nextHeightSupport = [0, nh1, nh1 + nh2]
         self.prevHeightSupport = [0, ph2, ph1 + ph2]  # <- inverted scoring here
         self.nextNextHeightSupport = [0, nn2, nn1 + nn2]
+        # support[height][key]: the support score for every reachable tally key, so
+        # scoring a worker is one lookup instead of the capping rules below
+        self.support = [[0] * (8 * NEXT_NEXT_W + 1) for _ in range(4)]
+        for height in range(4):
+            for same_h in range(9):
+                for next_h in range(9 - same_h):
+                    for prev_h in range(9 - same_h - next_h):
+                        for next_next_h in range(9 - same_h - next_h - prev_h):
+                            key = same_h * SAME_W + next_h * NEXT_W + prev_h * PREV_W + next_next_h * NEXT_NEXT_W
+                            self.support[height][key] = self.support_score(height, same_h, next_h, prev_h, next_next_h)
+        self.score = _compile_scorer(self)
 
-PARAMS = Parameters(
-    centrality_gap=20,
-    h2_gap=250,
-    sh1=60, sh2=30,
-    nh1=80, nh2=40,
-    ph1=20, ph2=10,
-    nn1=25, nn2=15,
-)
-
-TEMPO = 50
-
-def score_position(b: Board, parameters: Parameters = PARAMS) -> int:
-    def score_worker(worker_pos: int) -> int:
-        square = b.workers[worker_pos]
-        height = b.blocks[square]
-
-        p_score = parameters.posScore[square]
-        h_score = parameters.heightScore[height]
-
-        same_h = 0
-        next_h = 0
-        next_next_h = 0
-        prev_h = 0
-
-        for n in NEIGHBOURS[square]:
-            if b.is_free(n):
-                h = b.blocks[n]
-                if h == height:
-                    same_h += 1
-                elif h == height + 1:
-                    next_h += 1
-                elif h == height - 1:
-                    prev_h += 1
-                elif h == height + 2:
-                    next_next_h += 1
-
+    def support_score(self, height: int, same_h: int, next_h: int, prev_h: int, next_next_h: int) -> int:
+        """Support for a worker at 'height' with the given free-neighbour counts."""
         same_h = min(same_h, 2)
         next_h = min(next_h, 2)
 
@@ -76,13 +76,63 @@ def score_position(b: Board, parameters: Parameters = PARAMS) -> int:
         else:
             next_next_h = 0
 
-        support = (
-            parameters.sameHeightSupport[same_h]
-            + parameters.nextHeightSupport[next_h]
-            + parameters.prevHeightSupport[prev_h]
-            + parameters.nextNextHeightSupport[next_next_h]
+        return (
+            self.sameHeightSupport[same_h]
+            + self.nextHeightSupport[next_h]
+            + self.prevHeightSupport[prev_h]
+            + self.nextNextHeightSupport[next_next_h]
         )
 
-        return p_score + h_score + support
-    tempo_score = TEMPO if b.turn == 1 else 0
-    return score_worker(0) + score_worker(1) - score_worker(2) - score_worker(3) + tempo_score
+def _compile_scorer(parameters: Parameters):
+    """
+    Build score_position for one Parameters instance as straight-line code: the four
+    workers are unrolled (gray added, blue subtracted) and posScore + heightScore are
+    folded into one placement table, so a call makes no function calls or attribute
+    lookups beyond reading the board.
+    """
+    placement = tuple(
+        tuple(parameters.posScore[sq] + parameters.heightScore[h] for h in range(4))
+        for sq in range(25)
+    )
+    lines = [
+        'def score_position(b):',
+        '    blocks = b.blocks',
+        '    workers = b.workers',
+        '    total = TEMPO if b.turn == 1 else 0',
+    ]
+    for wi in range(4):
+        lines += [
+            f'    square = workers[{wi}]',
+            '    height = blocks[square]',
+            '    weight = NEIGHBOUR_WEIGHT[height]',
+            '    key = 0',
+            '    for n in NEIGHBOURS_T[square]:',
+            '        if n not in workers:',
+            '            key += weight[blocks[n]]',
+            f'    total {"+=" if wi < 2 else "-="} PLACEMENT[square][height] + SUPPORT[height][key]',
+        ]
+    lines.append('    return total')
+    namespace = {
+        'TEMPO': TEMPO,
+        'NEIGHBOUR_WEIGHT': NEIGHBOUR_WEIGHT,
+        'NEIGHBOURS_T': NEIGHBOURS_T,
+        'PLACEMENT': placement,
+        'SUPPORT': tuple(tuple(row) for row in parameters.support),
+    }
+    exec('\n'.join(lines) + '\n', namespace)
+    return namespace['score_position']
+
+# The engine's weights as constructor arguments, so the tuners can start from them
+PARAMS_ARGS = dict(
+    centrality_gap=20,
+    h2_gap=250,
+    sh1=60, sh2=30,
+    nh1=80, nh2=40,
+    ph1=20, ph2=10,
+    nn1=25, nn2=15,
+)
+PARAMS = Parameters(**PARAMS_ARGS)
+
+
+def score_position(b: Board, parameters: Parameters = PARAMS) -> int:
+    return parameters.score(b)
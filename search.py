@@ -5,36 +5,53 @@ from typing import Optional, List
 from Board import Board
 from Move import Move
 from board_tests import make_position
-from constants import DOUBLE_NEIGHBORS, God
-from evaluate import score_position
+from constants import DOUBLE_NEIGHBORS
+from evaluate import PARAMS
 from transposition_table import TranspositionTable
 
 
 MATE: int = 10000
-CHECK_EVERY: int = 4096  # how often we check for time in the search
+CHECK_EVERY: int = 4096  # how often we check for time in the search (a power of two)
+CHECK_MASK: int = CHECK_EVERY - 1
+LMR_MIN_DEPTH: int = 4  # reduced children still get two plies plus quiescence
+LMR_MIN_INDEX: int = 3  # moves before this (TT move and best-ordered) are never reduced
 WIN: int = 9999
+TT_MOVE_SCORE: int = 1 << 20  # sorts the stored best move ahead of every ordering score
 
 def is_mate(score: int) -> bool:
     return score > (MATE - 100) or score < (-MATE + 100)
 
 class SearchInfo:
+    __slots__ = ('board', 'depth', 'nodes', 'quit', 'end_time', 'bestMove')
+
     def __init__(self, board: Board, depth: int, end_time: float) -> None:
         self.board: Board = board            # Board reference
         self.depth: int = depth            # Current search depth
         self.nodes: int = 0                # Node counter
         self.quit: bool = False            # Set to True if time runs out
-        self.end_time: float = end_time    # Time (in seconds) when we must stop
+        self.end_time: float = end_time    # time.monotonic() deadline, in seconds
         self.bestMove: Optional[Move] = None  # Will store the best move found at this depth
 
 
 def evaluate(board: Board) -> int:
-    return score_position(board) * board.turn
+    return PARAMS.score(board) * board.turn
 
-def score_moves(moves: List[Move], board: Board) -> None:
+def score_moves(moves: List[Move], board: Board, tt_move: Optional[Move] = None) -> None:
+    # Hoisted once per node; every generated move reads both tables twice
+    blocks = board.blocks
+    double_neighbours = DOUBLE_NEIGHBORS
     for mv in moves:
-        from_h: int = board.blocks[mv.from_sq]
-        to_h: int = board.blocks[mv.final_sq]
-        mv.score = (to_h - from_h) * 10 + (DOUBLE_NEIGHBORS[mv.final_sq] - DOUBLE_NEIGHBORS[mv.from_sq])
+        from_sq = mv.from_sq
+        final_sq = mv.final_sq
+        mv.score = (blocks[final_sq] - blocks[from_sq]) * 10 + (double_neighbours[final_sq] - double_neighbours[from_sq])
+    if tt_move is not None:
+        # The stored move is an object from an earlier visit, so match it by code;
+        # the square checks keep code() off every other move.
+        tt_from, tt_final, tt_code = tt_move.from_sq, tt_move.final_sq, tt_move.code()
+        for mv in moves:
+            if mv.from_sq == tt_from and mv.final_sq == tt_final and mv.code() == tt_code:
+                mv.score = TT_MOVE_SCORE
+                break
 
 def pick_move(moves: List[Move], start_index: int) -> None:
     best_idx: int = start_index
@@ -47,45 +64,34 @@ def pick_move(moves: List[Move], start_index: int) -> None:
         moves[start_index], moves[best_idx] = moves[best_idx], moves[start_index]
 
 
-def qsearch(search_info: SearchInfo, alpha: int, beta: int) -> int:
+def qsearch(search_info: SearchInfo, alpha: int, beta: int, state_checked: bool = False) -> int:
+    """state_checked: the caller already saw check_state() == 0 for this position."""
     search_info.nodes += 1
 
-    if (search_info.nodes % CHECK_EVERY) == 0 and time.time() > search_info.end_time:
+    if not (search_info.nodes & CHECK_MASK) and time.monotonic() > search_info.end_time:
         search_info.quit = True
         return 0
 
-    state = search_info.board.check_state()
-    if state != 0:
-        return MATE - 1 if state == search_info.board.turn else -MATE + 1
+    board = search_info.board
+    if not state_checked:
+        state = board.check_state()
+        if state != 0:
+            return MATE - 1 if state == board.turn else -MATE + 1
 
-    stand_pat = evaluate(search_info.board)
+    stand_pat = evaluate(board)
     if stand_pat >= beta:
         return beta
     if stand_pat > alpha:
         alpha = stand_pat
 
     played = set()
-    for move in search_info.board.generate_moves():
+    # Climbs or Pan drop-wins only
+    for move in board.generate_moves(tactical_only=True):
         if (move.from_sq, move.final_sq) in played: continue
-        from_h = search_info.board.blocks[move.from_sq]
-        to_h = search_info.board.blocks[move.final_sq]
-
-        # Allow climbs or Pan drop-wins only
-        god_index = 0 if search_info.board.turn == 1 else 1
-        god = search_info.board.gods[god_index]
-
-        is_climb = to_h > from_h
-        is_pan_drop = (
-            god == God.PAN and from_h - to_h >= 2
-        )
-
-        if not (is_climb or is_pan_drop):
-            continue
-
-        search_info.board.make_move(move)
+        board.make_move(move)
         played.add((move.from_sq, move.final_sq))
         score = -qsearch(search_info, -beta, -alpha)
-        search_info.board.unmake_move(move)
+        board.unmake_move(move)
 
         if search_info.quit:
             return 0
@@ -103,32 +109,39 @@ def search(search_info: SearchInfo, depth: int, ply: int, alpha: int, beta: int,
     search_info.nodes += 1
 
     # Check time every CHECK_EVERY nodes.
-    if (search_info.nodes % CHECK_EVERY) == 0:
-        if time.time() > search_info.end_time:
+    if not (search_info.nodes & CHECK_MASK):
+        if time.monotonic() > search_info.end_time:
             search_info.quit = True
             search_info.bestMove = None
             return 0
 
-    state: int = search_info.board.check_state()
+    board = search_info.board
+    state: int = board.check_state()
     if state != 0:
         # Terminal state: adjust mate score by ply.
-        if state == search_info.board.turn:
+        if state == board.turn:
             # Win: faster mate (smaller ply) gives a higher score.
             return MATE - ply
         else:
             # Loss: delaying mate (larger ply) is better.
             return -MATE + ply
 
-    # Leaf node: return static evaluation.
+    # Leaf node: return static evaluation. The position is known not to be terminal,
+    # so qsearch can skip its own check_state (the no-legal-move scan is the costly part).
     if depth == 0:
-        return qsearch(search_info, alpha, beta)
+        return qsearch(search_info, alpha, beta, state_checked=True)
 
-    # Probe the transposition table.
-    tt_move, tt_score = tt.probe(search_info.board, alpha, beta, depth)
-    if tt_move is not None:
-        return tt_score
+    # Probe the transposition table; a bound that doesn't settle the node still narrows the window.
+    # The root only takes the stored move for ordering: get_best_move reports its move and
+    # score as exact, and an entry from an earlier call may only be a bound.
+    if ply == 0:
+        tt_move = tt.probe(board, alpha, beta, depth)[0]
+    else:
+        tt_move, tt_score, alpha, beta = tt.probe(board, alpha, beta, depth)
+        if tt_score is not None:
+            return tt_score
 
-    moves: List[Move] = search_info.board.generate_moves()
+    moves: List[Move] = board.generate_moves()
     if not moves:
         return -MATE + ply  # No moves: mate is inevitable.
 
@@ -136,15 +149,36 @@ def search(search_info: SearchInfo, depth: int, ply: int, alpha: int, beta: int,
     best_move: Optional[Move] = None
     original_alpha = alpha
 
-    score_moves(moves, search_info.board)
+    score_moves(moves, board, tt_move)
 
+    blocks = board.blocks
     for i in range(len(moves)):
         pick_move(moves, i)
         move = moves[i]
 
-        search_info.board.make_move(move)
-        curr_score = -search(search_info, depth - 1, ply + 1, -beta, -alpha, tt)
-        search_info.board.unmake_move(move)
+        # LMR: late moves that don't climb are searched a ply shallower first
+        reduce = i >= LMR_MIN_INDEX and depth >= LMR_MIN_DEPTH and blocks[move.final_sq] <= blocks[move.from_sq]
+
+        board.make_move(move)
+        if i == 0:
+            curr_score = -search(search_info, depth - 1, ply + 1, -beta, -alpha, tt)
+        else:
+            # PVS: the first (best-ordered) move is assumed best, so only prove the
+            # rest can't beat alpha with a null window; re-search the ones that do.
+            if reduce:
+                curr_score = -search(search_info, depth - 2, ply + 1, -alpha - 1, -alpha, tt)
+                if curr_score > alpha and not search_info.quit:
+                    curr_score = -search(search_info, depth - 1, ply + 1, -alpha - 1, -alpha, tt)
+            else:
+                curr_score = -search(search_info, depth - 1, ply + 1, -alpha - 1, -alpha, tt)
+            if alpha < curr_score < beta and not search_info.quit:
+                curr_score = -search(search_info, depth - 1, ply + 1, -beta, -alpha, tt)
+        board.unmake_move(move)
+
+        # An aborted subtree returns 0; don't let it reach the table.
+        if search_info.quit:
+            search_info.bestMove = None
+            return 0
 
         if curr_score > max_score:
             max_score = curr_score
@@ -152,19 +186,15 @@ def search(search_info: SearchInfo, depth: int, ply: int, alpha: int, beta: int,
             if max_score > alpha:
                 if max_score >= beta:
                     search_info.bestMove = best_move
-                    tt.store(search_info.board, best_move, beta, depth, 'B')
+                    tt.store(board, best_move, beta, depth, 'B')
                     return beta
                 alpha = max_score
 
-        if search_info.quit:
-            search_info.bestMove = None
-            return 0
-
     search_info.bestMove = best_move
     if alpha != original_alpha:
-        tt.store(search_info.board, best_move, max_score, depth, 'E')
+        tt.store(board, best_move, max_score, depth, 'E')
     else:
-        tt.store(search_info.board, best_move, alpha, depth, 'A')
+        tt.store(board, best_move, alpha, depth, 'A')
 
     return alpha
 
@@ -174,7 +204,8 @@ def get_best_move(board: Board, remaining_time_ms: int, tt: TranspositionTable,
     Use iterative deepening to find the best move.
     """
     thinking_time: int = floor(remaining_time_ms / 10)
-    start_time: float = time.time()
+    # Monotonic: a wall-clock adjustment mid-search must not cut it short or run it over
+    start_time: float = time.monotonic()
     end_time: float = start_time + (thinking_time / 1000.0)
     best_move = None
     best_score = None
@@ -182,8 +213,16 @@ def get_best_move(board: Board, remaining_time_ms: int, tt: TranspositionTable,
     while True:
         search_info = SearchInfo(board, depth, end_time)
         # Start the ply counter at 0.
-        search(search_info, depth, 0, -MATE, MATE, tt)
-        candidate_best_move, candidate_best_score = tt.probe_pv_move(board)
+        score = search(search_info, depth, 0, -MATE, MATE, tt)
+        if search_info.quit and best_move is not None:
+            break  # keep the move from the last completed depth
+
+        if search_info.bestMove is not None:
+            # The root finished its move loop: its move and score are the ones it just stored.
+            candidate_best_move, candidate_best_score = search_info.bestMove, score
+        else:
+            # Cut short (or terminal) before choosing a move; ask the table.
+            candidate_best_move, candidate_best_score = tt.probe_pv_move(board)
         if candidate_best_move is not None:
             best_move = candidate_best_move
             best_score = candidate_best_score
@@ -194,7 +233,7 @@ def get_best_move(board: Board, remaining_time_ms: int, tt: TranspositionTable,
         # Only break out of iterative deepening if a winning mate is found.
         if best_score is not None and is_mate(best_score):
             break
-        print(best_move.to_text(), best_score, depth, time.time() - start_time)
+        print(best_move.to_text(), best_score, depth, time.monotonic() - start_time)
 
         if max_depth is not None and depth == max_depth:
             break
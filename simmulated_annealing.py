@@ -4,10 +4,7 @@ import pandas as pd
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import log_loss
 from Board import Board
-from evaluate import Parameters, score_position
-import time
-import random
-from tqdm import tqdm
+from evaluate import PARAMS_ARGS, Parameters, score_position
 
 def get_conn(db_path=r"C:\Users\rafae\PycharmProjects\santoriniMediator\data\matches.db"):
     return sqlite3.connect(db_path)
@@ -18,44 +15,59 @@ def load_dataset():
     conn.close()
     match_results = dict(zip(match_df["Id"], match_df["Result"]))
 
-    match_lengths = positions_df.groupby("match_id")["move_count"].max().to_dict()
+    # Filter on the result column first so only the kept positions build a Board
+    results = positions_df["match_id"].map(match_results).fillna(0).to_numpy(dtype=int)
+    keep = (results != 0) & (np.abs(results) < 2)
 
     data = []
-    for _, row in positions_df.iterrows():
-        pos = row["position"]
-        match_id = row["match_id"]
-        move_count = row["move_count"]
-        result = match_results.get(match_id, 0)
-        if result == 0 or abs(result) >= 2:
-            continue
+    for pos, result in zip(positions_df["position"].to_numpy()[keep], results[keep].tolist()):
         board = Board(pos)
-        turn = board.turn
-        match_len = match_lengths.get(match_id, 1)
-        data.append((board, turn, result))
+        data.append((board, board.turn, result))
     return data
 
+def position_features(dataset):
+    """
+    For a fixed board, score_position is affine in the ten Parameters arguments (the
+    support caps depend only on neighbour counts). Scoring the dataset once with all
+    zeros and once per unit argument gives offsets and an (N, 10) coefficient matrix,
+    so any parameter vector scores every position as offsets + features @ params.
+    Scores are from the side to move.
+    """
+    def side_scores(values):
+        params = Parameters(*values)
+        return np.array([score_position(board, params) * turn for board, turn, _ in dataset], dtype=float)
+
+    zeros = [0] * 10
+    offsets = side_scores(zeros)
+    features = np.empty((len(dataset), 10))
+    for i in range(10):
+        unit = zeros.copy()
+        unit[i] = 1
+        features[:, i] = side_scores(unit) - offsets
+    return features, offsets
+
 dataset = load_dataset()
+features, offsets = position_features(dataset)
+labels = np.array([int(result == turn) for _, turn, result in dataset])
+
+# Only the first six arguments are tuned; the rest stay at the engine's values.
+ph1, ph2 = PARAMS_ARGS["ph1"], PARAMS_ARGS["ph2"]
+nn1, nn2 = PARAMS_ARGS["nn1"], PARAMS_ARGS["nn2"]
+
+# One model for every trial: warm_start lets lbfgs begin from the last trial's
+# coefficient, which is close since nearby parameter sets fit similar slopes.
+model = LogisticRegression(solver="lbfgs", fit_intercept=False, warm_start=True)
 
 def evaluate_entropy(centrality_gap, h2_gap, sh1, sh2, nh1, nh2):
     sigmoid_scale = 259.44  # from previous best fit
-    params = Parameters(centrality_gap, h2_gap, sh1, sh2, nh1, nh2)
-    scores = []
-    labels = []
-    for board, turn, result in dataset:
-        score = score_position(board, params)
-        if turn == -1:
-            score = -score
-        scaled_score = score * sigmoid_scale
-        scores.append(scaled_score)
-        labels.append(int(result == turn))
-
-    X = np.array(scores).reshape(-1, 1)
-    y = np.array(labels)
-
-    model = LogisticRegression(solver="lbfgs", fit_intercept=False)
-    model.fit(X, y)
+    params = np.array([centrality_gap, h2_gap, sh1, sh2, nh1, nh2, ph1, ph2, nn1, nn2], dtype=float)
+    scores = offsets + features @ params
+
+    X = (scores * sigmoid_scale).reshape(-1, 1)
+
+    model.fit(X, labels)
     probs = model.predict_proba(X)[:, 1]
-    return log_loss(y, probs)
+    return log_loss(labels, probs)
 
 
 import optuna
@@ -4,6 +4,8 @@ from Move import Move
 
 
 class TTEntry:
+    __slots__ = ('hash_key', 'move', 'depth', 'score', 'flag')
+
     def __init__(self, hash_key: int, move: Move, depth: int, score: int, flag: str):
         self.hash_key = hash_key  # Unique hash for the board position
         self.move = move          # Best move from this position
@@ -16,9 +18,13 @@ class TranspositionTable:
     def __init__(self, num_entries: int = (1 << 22)):
         """
         Initialize a fixed-size table.
-        Default is 2^20 entries, but you can adjust this based on available memory.
+        Default is 2^22 entries, but you can adjust this based on available memory;
+        the size must be a power of two so the index is a mask of the key.
         """
+        if num_entries <= 0 or num_entries & (num_entries - 1):
+            raise ValueError(f"num_entries must be a power of two, got {num_entries}")
         self.num_entries: int = num_entries
+        self.mask: int = num_entries - 1  # key & mask == key % num_entries for a power of two
         self.table: List[Optional[TTEntry]] = [None] * self.num_entries
         self.new_writes: int = 0
         self.overwrites: int = 0
@@ -41,7 +47,7 @@ class TranspositionTable:
           - 'E' if the score is exact (improved alpha)
         """
         key = hash(board)
-        idx = key % self.num_entries
+        idx = key & self.mask
         if self.table[idx] is None:
             self.new_writes += 1
         else:
@@ -51,43 +57,57 @@ class TranspositionTable:
     def probe(self, board, alpha: int, beta: int, depth: int):
         """
         Probe the table for an entry corresponding to the current board.
-        Returns (move, score) if a stored entry exists that meets the depth requirement;
-        otherwise returns (None, None).
+        Returns (move, score, alpha, beta). move is the stored best move whenever the
+        position matches, whatever its depth, so the caller can search it first.
+        score is not None when a stored entry that meets the depth requirement settles
+        the node; otherwise alpha and beta come back tightened by whatever bound the
+        entry carries.
 
         The logic is:
-          - If flag == 'A' and stored score <= alpha, return alpha.
-          - If flag == 'B' and stored score >= beta, return beta.
           - If flag == 'E', return the exact stored score.
+          - If flag == 'A', the stored score caps beta.
+          - If flag == 'B', the stored score raises alpha.
+          - If the window closes, return the bound that closed it.
         """
         key: int = hash(board)  # Use the built-in hash
-        index = key % self.num_entries
+        index = key & self.mask
         entry = self.table[index]
-        if entry is not None and entry.hash_key == key and entry.depth >= depth:
+        if entry is None or entry.hash_key != key:
+            return None, None, alpha, beta
+        if entry.depth >= depth:
             self.hits += 1
-            if entry.flag == 'A' and entry.score <= alpha:
-                return entry.move, alpha
-            elif entry.flag == 'B' and entry.score >= beta:
-                return entry.move, beta
-            elif entry.flag == 'E':
-                return entry.move, entry.score
-        return None, None
+            score = entry.score
+            if entry.flag == 'E':
+                return entry.move, score, alpha, beta
+            if entry.flag == 'A':
+                if score <= alpha:
+                    return entry.move, alpha, alpha, beta
+                if score < beta:
+                    beta = score
+            else:
+                if score >= beta:
+                    return entry.move, beta, alpha, beta
+                if score > alpha:
+                    alpha = score
+        return entry.move, None, alpha, beta
 
     def probe_pv_move(self, board):
         """
         Retrieve the principal variation move (if any) for the given board.
         """
         key = hash(board)
-        index = key % self.num_entries
+        index = key & self.mask
         entry = self.table[index]
         if entry is not None and entry.hash_key == key:
             return entry.move, entry.score
         return None, None
 
     def probe_pv_line(self, board):
+        board = board.clone()  # walk the line on a copy, leave the caller's board intact
         pv_line = []
         while True:
             key = hash(board)
-            index = key % self.num_entries
+            index = key & self.mask
             entry = self.table[index]
             if entry is None or entry.hash_key != key or entry.move is None:
                 break